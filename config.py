@@ -20,6 +20,9 @@ MYSQL_HOST = os.getenv("MYSQL_HOST")
 MYSQL_USER = os.getenv("MYSQL_USER")
 MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD")
 MYSQL_DATABASE = os.getenv("MYSQL_DATABASE")
+MYSQL_SOCKET = os.getenv("MYSQL_SOCKET", "/var/run/mysqld/mysqld.sock")
+MYSQL_POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "20"))
+MYSQL_POOL_MIN_CACHED = int(os.getenv("MYSQL_POOL_MIN_CACHED", "5"))
 MODE = os.getenv('MODE')
 MODE_TEST = os.getenv('MODE_TEST')
 LOGGER_PATH = './logger/'
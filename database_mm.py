@@ -1,17 +1,176 @@
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
 import json
 import os
+import queue
+import threading
 import time
+import uuid
+import itertools
 import datetime
+import decimal
 import redis
 import mysql.connector
-import pymysql
+try:
+    # mysqlclient (C driver) decodes result sets much faster; pymysql is the pure-Python fallback.
+    # Only the DB-API surface both share is used: connect(), MySQLError and the PooledDB creator.
+    import MySQLdb as _driver
+except ImportError:
+    import pymysql as _driver
 from logger import logger_database
-from config import MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE
+from config import MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE, MYSQL_SOCKET, MYSQL_POOL_SIZE, MYSQL_POOL_MIN_CACHED
+
+try:
+    from dbutils.pooled_db import PooledDB
+except Exception:
+    PooledDB = None
+
 r = redis.Redis(host='localhost', port=6379, decode_responses=True)
 
+# Shared pool of live MySQL connections, created on first use
+_POOL = None
+
+# Read-through cache for hot lookups whose results only change on our own writes
+DB_CACHE_TTL = 5
+INFLOW_LAST_ROW_KEY = "inflow:last_row"
+MAKE_ORDERS_KEY = "make_orders:all"
+
+def _cache_get(key):
+    """
+    Reads a JSON value from Redis.
+
+    Returns:
+        str or None: The raw cached value, or None on miss or Redis error.
+    """
+    try:
+        return r.get(key)
+    except Exception as err:
+        logger_database.error(f"Error reading cache {key}: {err}")
+        return None
+
+def _cache_set(key, value, ttl=DB_CACHE_TTL, default=str):
+    """
+    Stores a value in Redis as JSON with a TTL; dates and decimals are stored as strings
+    unless `default` encodes them otherwise (see _cache_encode_typed).
+    """
+    try:
+        r.setex(key, ttl, json.dumps(value, default=default))
+    except Exception as err:
+        logger_database.error(f"Error writing cache {key}: {err}")
+
+# Tags for column types JSON has no type for, so cached rows decode to the driver's types
+_CACHE_TYPE_TAG = "__t"
+
+def _cache_encode_typed(value):
+    """
+    json.dumps default hook: tags datetime, date, timedelta and Decimal values
+    so _cache_decode_typed can rebuild them.
+    """
+    if isinstance(value, datetime.datetime):
+        return {_CACHE_TYPE_TAG: "datetime", "v": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {_CACHE_TYPE_TAG: "date", "v": value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {_CACHE_TYPE_TAG: "timedelta", "v": value.total_seconds()}
+    if isinstance(value, decimal.Decimal):
+        return {_CACHE_TYPE_TAG: "decimal", "v": str(value)}
+    return str(value)
+
+def _cache_decode_typed(obj):
+    """
+    json.loads object_hook reversing _cache_encode_typed.
+    """
+    kind = obj.get(_CACHE_TYPE_TAG)
+    if kind == "datetime":
+        return datetime.datetime.fromisoformat(obj["v"])
+    if kind == "date":
+        return datetime.date.fromisoformat(obj["v"])
+    if kind == "timedelta":
+        return datetime.timedelta(seconds=obj["v"])
+    if kind == "decimal":
+        return decimal.Decimal(obj["v"])
+    return obj
+
+def _cache_delete(*keys):
+    """
+    Invalidates cached values after a write.
+    """
+    try:
+        r.delete(*keys)
+    except Exception as err:
+        logger_database.error(f"Error invalidating cache {keys}: {err}")
+
+# Last formatted "now"; rows written within the same second share the string
+_now_cache = (None, None)
+
+def _now_str(unix_second=None):
+    """
+    Returns the local time as 'YYYY-MM-DD HH:MM:SS', formatting at most once per second.
+
+    Args:
+        unix_second (int, optional): The unix second to format; defaults to the current time.
+    """
+    global _now_cache
+    if unix_second is None:
+        unix_second = int(time.time())
+    cached_second, cached_str = _now_cache
+    if cached_second != unix_second:
+        cached_str = datetime.datetime.fromtimestamp(unix_second).strftime('%Y-%m-%d %H:%M:%S')
+        _now_cache = (unix_second, cached_str)
+    return cached_str
+
+def _connect_kwargs():
+    """
+    Returns the MySQL driver connection arguments. When MySQL runs on this host and its
+    UNIX socket exists, the socket is used instead of loopback TCP.
+
+    Returns:
+        dict: Keyword arguments for _driver.connect (MySQLdb or pymysql).
+    """
+    kwargs = dict(
+        user=MYSQL_USER,
+        password=MYSQL_PASSWORD,
+        database=MYSQL_DATABASE,
+        connect_timeout=10,  # Timeout 10 giây
+        # Cố định charset để MySQLdb và pymysql (mặc định tùy phiên bản) decode giống nhau
+        charset="utf8mb4",
+        use_unicode=True,
+    )
+    if MYSQL_HOST in ('localhost', '127.0.0.1') and MYSQL_SOCKET and os.path.exists(MYSQL_SOCKET):
+        kwargs['unix_socket'] = MYSQL_SOCKET
+    else:
+        kwargs['host'] = MYSQL_HOST
+        kwargs['port'] = 3306
+    return kwargs
+
+def _get_pool():
+    """
+    Returns the module-level connection pool, creating it on first use.
+
+    Returns:
+        PooledDB or None: The pool, or None when DBUtils is not installed.
+    """
+    global _POOL
+    if _POOL is None and PooledDB is not None:
+        _POOL = PooledDB(
+            creator=_driver,
+            mincached=min(MYSQL_POOL_MIN_CACHED, MYSQL_POOL_SIZE),
+            maxcached=max(MYSQL_POOL_SIZE // 2, 1),
+            maxconnections=MYSQL_POOL_SIZE,
+            blocking=True,
+            ping=1,  # Kiểm tra kết nối còn sống trước khi dùng lại
+            **_connect_kwargs()
+        )
+    return _POOL
+
 def get_connection():
     """
     Establishes a connection to a MySQL database with retry mechanism.
+    Connections are borrowed from the shared pool when DBUtils is available,
+    so close_connection() hands them back instead of closing the socket.
 
     Args:
         retries (int): Số lần thử lại khi kết nối thất bại.
@@ -25,17 +184,14 @@ def get_connection():
     attempt = 0
     while attempt < retries:
         try:
-            connection = pymysql.connect(
-                host=MYSQL_HOST,
-                user=MYSQL_USER,
-                password=MYSQL_PASSWORD,
-                database=MYSQL_DATABASE,
-                port=3306,
-                connect_timeout=10  # Timeout 10 giây
-            )
+            pool = _get_pool()
+            if pool is not None:
+                connection = pool.connection()
+            else:
+                connection = _driver.connect(**_connect_kwargs())
             cursor = connection.cursor()
             return connection, cursor
-        except pymysql.MySQLError as err:
+        except _driver.MySQLError as err:
             logger_database.error(f"Database connection attempt {attempt + 1} failed: {err}")
             attempt += 1
             time.sleep(delay)  # Chờ trước khi thử lại
@@ -46,6 +202,7 @@ def get_connection():
 def close_connection(connection, cursor):
     """
     Safely close a MySQL cursor and connection. Accepts None and logs close errors.
+    A pooled connection is returned to the pool rather than closed.
 
     Args:
         connection: The MySQL connection object or None.
@@ -66,6 +223,34 @@ def close_connection(connection, cursor):
         # Ensure close never raises further exceptions
         pass
 
+@contextlib.contextmanager
+def transaction():
+    """
+    Borrows one connection for a batch of writes and commits them together.
+    Helpers that accept connection/cursor skip their own commit when given them,
+    so a batch pays a single commit instead of one per row. Rolls back on error.
+
+    Yields:
+        tuple: (connection, cursor)
+
+    Example:
+        with transaction() as (connection, cursor):
+            for order in orders:
+                insert_make_order(order, connection=connection, cursor=cursor)
+    """
+    connection, cursor = get_connection()
+    if connection is None:
+        raise _driver.MySQLError("Could not connect to MySQL")
+    try:
+        yield connection, cursor
+        connection.commit()
+        _cache_delete(INFLOW_LAST_ROW_KEY, MAKE_ORDERS_KEY)
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        close_connection(connection, cursor)
+
 def execute_script_location(abs_paths_list):
     """
     Executes a script location in the database.
@@ -79,25 +264,22 @@ def execute_script_location(abs_paths_list):
     Raises:
         Exception: If there is an error connecting to the MySQL database.
     """
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
-        # Check if the row exists in the database for each absolute path
-        for abs_path in abs_paths_list:
-            query = "SELECT COUNT(*) FROM script_locations WHERE location = %s"
-            cursor.execute(query, (abs_path,))
-            result = cursor.fetchone()
-            if result[0] == 0:
-                # If the row does not exist, insert it
-                current_date = datetime.datetime.now()
-                formatted_date = current_date.strftime('%Y-%m-%d %H:%M:%S')
-                insert_query = """INSERT INTO script_locations (location, name, created_at, deleted_at, updated_at) 
-                                    VALUES (%s, %s, %s, NULL, %s)
-                                    ON DUPLICATE KEY UPDATE
-                                    location = VALUES(location),
-                                    updated_at = VALUES(updated_at)"""
-                cursor.execute(insert_query, (abs_path, os.path.basename(abs_path), formatted_date, formatted_date))
-                connection.commit()
-                logger_database.info(f"Inserted: {os.path.basename(abs_path)} - {abs_path}")
+        # Upsert every path in one multi-row statement; existing rows are left untouched
+        if abs_paths_list:
+            formatted_date = _now_str()
+            values_sql = ", ".join(["(%s, %s, %s, NULL, %s)"] * len(abs_paths_list))
+            insert_query = f"""INSERT INTO script_locations (location, name, created_at, deleted_at, updated_at) 
+                                VALUES {values_sql}
+                                ON DUPLICATE KEY UPDATE
+                                location = VALUES(location)"""
+            insert_params = list(itertools.chain.from_iterable(
+                (abs_path, os.path.basename(abs_path), formatted_date, formatted_date) for abs_path in abs_paths_list
+            ))
+            cursor.execute(insert_query, insert_params)
+            logger_database.info(f"Inserted {cursor.rowcount} new script locations")
         
         # Now, delete rows from the table where the location does not exist in abs_paths
         # delete_query = "DELETE FROM script_locations WHERE location NOT IN (%s)" % ', '.join(['%s'] * len(abs_paths_list))
@@ -108,16 +290,18 @@ def execute_script_location(abs_paths_list):
         connection.commit()
         logger_database.info("Deleted rows with locations not found in the filesystem.")
 
-        close_connection(connection, cursor)
     except Exception as err:
         logger_database.error(f"Error connecting to MySQL: {err}")
+    finally:
+        close_connection(connection, cursor)
     
-def insert_stop_strategy_tracking(key):
+def insert_stop_strategy_tracking(key, connection=None, cursor=None):
     """
     Inserts a new tracking action into the `tracking_actions` table in the MySQL database.
 
     Args:
         key (str): The key name of the tracking action.
+        connection, cursor (optional): From transaction(); the caller commits and errors are raised.
 
     Returns:
         None
@@ -126,29 +310,35 @@ def insert_stop_strategy_tracking(key):
         Exception: If there is an error connecting to the MySQL database.
 
     """
+    own_connection = connection is None
     try:
         # Connect to the MySQL server
-        connection, cursor = get_connection()
-        current_date = datetime.datetime.now()
-        formatted_date = current_date.strftime('%Y-%m-%d %H:%M:%S')
+        if own_connection:
+            connection, cursor = get_connection()
+        formatted_date = _now_str()
         insert_query = """INSERT INTO tracking_actions (key_name, action, created_at, deleted_at, updated_at) 
                             VALUES (%s, %s, %s, NULL, %s)"""
         cursor.execute(insert_query, (key, 1, formatted_date, formatted_date))
         # Commit the changes
-        connection.commit()
+        if own_connection:
+            connection.commit()
         logger_database.info(f"Inserted: {key} stop into TrackingAction table")
 
-        close_connection(connection, cursor)
-
     except Exception as err:
         logger_database.error(f"Error connecting to MySQL: {err}")    
+        if not own_connection:
+            raise
+    finally:
+        if own_connection:
+            close_connection(connection, cursor)
 
-def update_strategy_tracking_status(key, status):
+def update_strategy_tracking_status(key, status, connection=None, cursor=None):
     """
     Inserts a new tracking action into the `tracking_actions` table in the MySQL database.
 
     Args:
         key (str): The key name of the tracking action.
+        connection, cursor (optional): From transaction(); the caller commits and errors are raised.
 
     Returns:
         None
@@ -157,35 +347,39 @@ def update_strategy_tracking_status(key, status):
         Exception: If there is an error connecting to the MySQL database.
 
     """
+    own_connection = connection is None
     try:
         # Connect to the MySQL server
-        connection, cursor = get_connection()
-        current_date = datetime.datetime.now()
-        formatted_date = current_date.strftime('%Y-%m-%d %H:%M:%S')
-        update_query =  """ UPDATE tracking_actions 
-                            SET status = %s, updated_at = %s 
-                            WHERE key_name = %s"""
+        if own_connection:
+            connection, cursor = get_connection()
+        formatted_date = _now_str()
+        # Nếu status = 9, cập nhật luôn bảng params trong cùng một câu UPDATE JOIN
+        if status == 9:
+            update_query = """UPDATE tracking_actions t
+                              LEFT JOIN params p ON p.id = t.param_id
+                              SET t.status = %s, t.updated_at = %s, p.status = 9
+                              WHERE t.key_name = %s"""
+        else:
+            update_query =  """ UPDATE tracking_actions 
+                                SET status = %s, updated_at = %s 
+                                WHERE key_name = %s"""
         cursor.execute(update_query, (status, formatted_date, key))
-        
-        # Nếu status = 9, cập nhật thêm bảng params
         if status == 9:
-            # Thực hiện truy vấn JOIN để cập nhật status trong bảng params
-            update_params_query = """UPDATE params p
-                                     JOIN tracking_actions t ON p.id = t.param_id
-                                     SET p.status = 9
-                                     WHERE t.key_name = %s"""
-            cursor.execute(update_params_query, (key,))
             logger_database.info(f"Updated status in params table for key: {key}")
 
         # Commit the changes
-        connection.commit()
+        if own_connection:
+            connection.commit()
         logger_database.info(f"Updated: {key} - status {status} in TrackingAction table")
 
     except Exception as err:
         logger_database.error(f"Error connecting to MySQL: {err}")    
+        if not own_connection:
+            raise
     finally:
         # Đảm bảo luôn đóng kết nối và con trỏ, dù có lỗi hay không
-        close_connection(connection, cursor)
+        if own_connection:
+            close_connection(connection, cursor)
 
     
 def insert_or_update_inflow_record(exchange_name, symbol, start_time, end_time, 
@@ -208,18 +402,19 @@ def insert_or_update_inflow_record(exchange_name, symbol, start_time, end_time,
         small_orders_sell (float): The small orders sell.
 
     Returns:
-        None
+        int or Exception: The id of the inserted or updated row, or an Exception if an error occurs.
 
     Raises:
         Exception: If there is an error connecting to the MySQL database.
 
     """
+    connection = cursor = None
     try:
         # Connect to the MySQL server
         connection, cursor = get_connection()
         
         # Get the current timestamp for created_at and updated_at
-        current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        current_timestamp = _now_str()
         
         # Prepare the INSERT statement with ON DUPLICATE KEY UPDATE clause
         upsert_query = """
@@ -236,7 +431,8 @@ def insert_or_update_inflow_record(exchange_name, symbol, start_time, end_time,
             medium_orders_sell = VALUES(medium_orders_sell),
             small_orders_buy = VALUES(small_orders_buy),
             small_orders_sell = VALUES(small_orders_sell),
-            updated_at = VALUES(updated_at)
+            updated_at = VALUES(updated_at),
+            id = LAST_INSERT_ID(id)
         """
         
         # Execute the INSERT or UPDATE statement
@@ -247,7 +443,9 @@ def insert_or_update_inflow_record(exchange_name, symbol, start_time, end_time,
         
         # Commit the transaction
         connection.commit()
-        return True
+        _cache_delete(INFLOW_LAST_ROW_KEY)
+        # LAST_INSERT_ID(id) in the update clause makes lastrowid the row id on both paths
+        return cursor.lastrowid
     except Exception as err:
         logger_database.error(f"Error: {err}")
         return err
@@ -259,13 +457,21 @@ def insert_or_update_inflow_record(exchange_name, symbol, start_time, end_time,
 def inflow_get_last_row():
     """
     Retrieves the last row from the 'inflows' table in the MySQL database.
+    The row is cached in Redis for a few seconds and invalidated by insert_or_update_inflow_record;
+    date and decimal columns are tagged in the cache so a cached read returns the same types as MySQL.
 
     Returns:
-        dict or Exception: The last row from the 'inflows' table as a dictionary, or an Exception if an error occurs.
+        tuple or Exception: The last row from the 'inflows' table, or an Exception if an error occurs.
 
     Raises:
         Exception: If an error occurs while connecting to the database or executing the SQL query.
     """
+    cached = _cache_get(INFLOW_LAST_ROW_KEY)
+    if cached is not None:
+        last_row = json.loads(cached, object_hook=_cache_decode_typed)
+        return tuple(last_row) if last_row is not None else None
+
+    connection = cursor = None
     try:
         # Connect to the MySQL server
         connection, cursor = get_connection()
@@ -278,8 +484,9 @@ def inflow_get_last_row():
         
         # Fetch the last row
         last_row = cursor.fetchone()
+        _cache_set(INFLOW_LAST_ROW_KEY, last_row, default=_cache_encode_typed)
         
-        return last_row
+        return tuple(last_row) if last_row is not None else None
         
     except Exception as err:
         logger_database.error(f"Error: {err}")
@@ -289,7 +496,58 @@ def inflow_get_last_row():
         # Close the cursor and connection
         close_connection(connection, cursor)
     
-def insert_make_order(order):
+MAKE_ORDER_COLUMNS = "(order_id, exchange, strategy_name, api_key, account_id, param_id, symbol, note, created_at, updated_at)"
+MAKE_ORDER_PLACEHOLDERS = "(" + ", ".join(["%s"] * 10) + ")"
+
+FINAL_ORDER_COLUMNS = """(order_id, symbol, symbol_norm, exchange, strategy_name, api_key, account_id, param_id, client_order_id, 
+                quantity, status, price, side, filled_price, filled_size, order_type, fee, order_create_time, order_update_time, 
+                created_at, updated_at, note)"""
+FINAL_ORDER_PLACEHOLDERS = "(" + ", ".join(["%s"] * 22) + ")"
+
+# Rows per multi-row INSERT in the bulk helpers
+BULK_INSERT_CHUNK_SIZE = 500
+
+def _make_order_row(order, current_timestamp):
+    return (order['order_id'], order['exchange'], order['strategy_name'], order['api_key'], order['account_id'], 
+            order['param_id'], order['symbol'], order['note'], current_timestamp, current_timestamp)
+
+@functools.lru_cache(maxsize=4096)
+def _norm_symbol(symbol):
+    return symbol.replace('-', '').replace('_', '').upper()
+
+@functools.lru_cache(maxsize=256)
+def _upper_enum(value):
+    # status / side / orderType have only a handful of values
+    return str(value).upper()
+
+def _final_order_row(order, current_timestamp):
+    # convert datetime to miliseconds
+    if order['orderCreateTime'] is not None and len(str(order['orderCreateTime'])) == 10:
+        order['orderCreateTime'] = int(order['orderCreateTime']) * 1000
+    if order['orderUpdateTime'] is not None and len(str(order['orderUpdateTime'])) == 10:
+        order['orderUpdateTime'] = int(order['orderUpdateTime']) * 1000
+
+    symbol_norm = ""
+    if 'symbol' in order:
+        symbol_norm = _norm_symbol(order['symbol'])
+
+    return (order['orderId'], order['symbol'], symbol_norm, order['exchange'], order['strategyName'], order['apiKey'], 
+            order['accountId'], order['paramId'], order['clientOrderId'], order['quantity'], 
+            _upper_enum(order['status']), order['price'], _upper_enum(order['side']), order['fillPrice'], 
+            order['fillQuantity'], _upper_enum(order['orderType']), order['fee'], order['orderCreateTime'], 
+            order['orderUpdateTime'], current_timestamp, current_timestamp, order['note'])
+
+def _bulk_insert(cursor, table, columns, placeholders, rows, chunk_size=BULK_INSERT_CHUNK_SIZE, suffix=""):
+    """
+    Inserts rows with one multi-row INSERT per chunk of chunk_size rows.
+    suffix is appended to each statement, e.g. an ON DUPLICATE KEY UPDATE clause.
+    """
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        insert_query = f"INSERT INTO {table} {columns} VALUES {', '.join([placeholders] * len(chunk))} {suffix}"
+        cursor.execute(insert_query, list(itertools.chain.from_iterable(chunk)))
+
+def insert_make_order(order, connection=None, cursor=None):
     """
     Inserts an order into the 'make_orders' table in the MySQL database.
 
@@ -303,6 +561,7 @@ def insert_make_order(order):
             - 'param_id' (str): The ID of the parameters used to place the order.
             - 'symbol' (str): The symbol of the asset being traded.
             - 'note' (str): Any additional notes or comments about the order.
+        connection, cursor (optional): From transaction(); the caller commits and errors are raised.
 
     Returns:
         None or Exception: If an error occurs while inserting the order, an Exception is returned. Otherwise, None is returned.
@@ -313,24 +572,60 @@ def insert_make_order(order):
     Note:
         The 'created_at' and 'updated_at' columns are set to the current timestamp.
     """
+    own_connection = connection is None
     try:
-        connection, cursor = get_connection()
+        if own_connection:
+            connection, cursor = get_connection()
         
-        current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        current_timestamp = _now_str()
         
-        insert_query = """
-            INSERT INTO make_orders (order_id, exchange, strategy_name, api_key, account_id, param_id, symbol, note, created_at, updated_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        insert_query = f"""
+            INSERT INTO make_orders {MAKE_ORDER_COLUMNS}
+            VALUES {MAKE_ORDER_PLACEHOLDERS}
             """
         
-        cursor.execute(insert_query, (order['order_id'], order['exchange'], order['strategy_name'], order['api_key'], order['account_id'], 
-                                      order['param_id'], order['symbol'], order['note'], current_timestamp, current_timestamp))
+        cursor.execute(insert_query, _make_order_row(order, current_timestamp))
         
-        connection.commit()
+        if own_connection:
+            connection.commit()
+            _cache_delete(MAKE_ORDERS_KEY)
         return True
     except Exception as err:
         logger_database.error(f"Error inserting row:{err}  {err.__traceback__.tb_lineno}")
         logger_database.error(f"Error inserting row:{order}")
+        if not own_connection:
+            raise
+        return err
+        
+    finally:
+        if own_connection:
+            close_connection(connection, cursor)
+
+def insert_make_orders_bulk(orders):
+    """
+    Inserts several orders into the 'make_orders' table with multi-row INSERTs and a single commit.
+
+    Args:
+        orders (List[dict]): Orders with the same keys as insert_make_order expects.
+
+    Returns:
+        bool or Exception: True if successful, otherwise the Exception raised.
+    """
+    if not orders:
+        return True
+    connection = cursor = None
+    try:
+        connection, cursor = get_connection()
+        
+        current_timestamp = _now_str()
+        rows = [_make_order_row(order, current_timestamp) for order in orders]
+        _bulk_insert(cursor, "make_orders", MAKE_ORDER_COLUMNS, MAKE_ORDER_PLACEHOLDERS, rows)
+        
+        connection.commit()
+        _cache_delete(MAKE_ORDERS_KEY)
+        return True
+    except Exception as err:
+        logger_database.error(f"Error inserting {len(orders)} make orders:{err}")
         return err
         
     finally:
@@ -356,8 +651,15 @@ def fetch_all_make_order():
 
     Note:
         Only orders that have not been marked as deleted are returned.
+        The list is cached in Redis for a few seconds and invalidated by
+        insert_make_order and soft_delete_make_order.
 
     """
+    cached = _cache_get(MAKE_ORDERS_KEY)
+    if cached is not None:
+        return json.loads(cached)
+
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
         # current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -367,19 +669,9 @@ def fetch_all_make_order():
                             WHERE deleted_at IS NULL
                         """
         cursor.execute(select_query)
-        result =[]
-        list_make_orders = cursor.fetchall()
-        for make_order in list_make_orders:
-            result.append([
-                        make_order[0], # order_id
-                        make_order[1], # exchange
-                        make_order[2], # strategy_name
-                        make_order[3], # api_key
-                        make_order[4], # account_id
-                        make_order[5], # param_id
-                        make_order[6], # symbol
-                        make_order[7], # note
-                    ])
+        # Rows already come back in the documented column order
+        result = list(map(list, cursor.fetchall()))
+        _cache_set(MAKE_ORDERS_KEY, result)
         return result
     except Exception as err:
         logger_database.error(f"Error soft deleting rows: {err}")
@@ -403,21 +695,23 @@ def soft_delete_make_order(order_id):
 
     Notes:
         - This function retrieves a database connection and cursor using the `get_connection()` function.
-        - The current timestamp is obtained using `datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')`.
+        - The current timestamp is obtained using `_now_str()`.
         - The `UPDATE` query is executed using the `cursor.execute()` method.
         - The `connection.commit()` method is called to commit the changes to the database.
         - If an error occurs during the soft deletion process, the error is logged using the `logger_database.error()` method.
         - The `close_connection()` function is called to close the database connection and cursor.
 
     """
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
-        current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        current_timestamp = _now_str()
        
         update_query = "UPDATE make_orders SET deleted_at = %s WHERE order_id = %s"
         cursor.execute(update_query, (current_timestamp, order_id))
         logger_database.info(f"Soft deleted row with id {order_id} successfully.")
         connection.commit()
+        _cache_delete(MAKE_ORDERS_KEY)
         return True
     except Exception as err:
         logger_database.error(f"orderID {order_id}")
@@ -427,49 +721,70 @@ def soft_delete_make_order(order_id):
     finally:
         close_connection(connection, cursor)
 
-def insert_final_order(order):
+def insert_final_order(order, connection=None, cursor=None):
     """
     Inserts a final order into the database.
 
     Args:
         order (dict): A dictionary containing the order details.
+        connection, cursor (optional): From transaction(); the caller commits and errors are raised.
 
     Returns:
         None if the insertion is successful, otherwise an error message.
     """
+    own_connection = connection is None
     try:
-        connection, cursor = get_connection()
-        # convert datetime to miliseconds
-        if order['orderCreateTime'] is not None and len(str(order['orderCreateTime'])) == 10:
-            order['orderCreateTime'] = int(order['orderCreateTime']) * 1000
-        if order['orderUpdateTime'] is not None and len(str(order['orderUpdateTime'])) == 10:
-            order['orderUpdateTime'] = int(order['orderUpdateTime']) * 1000
-
+        if own_connection:
+            connection, cursor = get_connection()
 
-        current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        current_timestamp = _now_str()
 
-        insert_query = """
-            INSERT INTO final_orders (order_id, symbol, symbol_norm, exchange, strategy_name, api_key, account_id, param_id, client_order_id, 
-                quantity, status, price, side, filled_price, filled_size, order_type, fee, order_create_time, order_update_time, 
-                created_at, updated_at, note)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        insert_query = f"""
+            INSERT INTO final_orders {FINAL_ORDER_COLUMNS}
+            VALUES {FINAL_ORDER_PLACEHOLDERS}
             """
 
-        symbol_norm = ""
-        if 'symbol' in order:
-            symbol_norm = order['symbol'].replace('-', '').replace('_', '').upper()
-
-        cursor.execute(insert_query, (order['orderId'], order['symbol'], symbol_norm, order['exchange'], order['strategyName'], order['apiKey'], 
-                                      order['accountId'], order['paramId'], order['clientOrderId'], order['quantity'], 
-                                      str(order['status']).upper(), order['price'], str(order['side']).upper(), order['fillPrice'], 
-                                      order['fillQuantity'], str(order['orderType']).upper(), order['fee'], order['orderCreateTime'], 
-                                      order['orderUpdateTime'], current_timestamp, current_timestamp, order['note']))
-        connection.commit()
+        cursor.execute(insert_query, _final_order_row(order, current_timestamp))
+        if own_connection:
+            connection.commit()
         return None
 
     except Exception as err:
         logger_database.error(f"order {order}")
         logger_database.error(f"Error inserting row:{err}")
+        if not own_connection:
+            raise
+        return err
+
+    finally:
+        if own_connection:
+            close_connection(connection, cursor)
+        
+def insert_final_orders_bulk(orders):
+    """
+    Inserts several final orders into the database with multi-row INSERTs and a single commit.
+
+    Args:
+        orders (List[dict]): Orders with the same keys as insert_final_order expects.
+
+    Returns:
+        None if the insertion is successful, otherwise an error message.
+    """
+    if not orders:
+        return None
+    connection = cursor = None
+    try:
+        connection, cursor = get_connection()
+
+        current_timestamp = _now_str()
+        rows = [_final_order_row(order, current_timestamp) for order in orders]
+        _bulk_insert(cursor, "final_orders", FINAL_ORDER_COLUMNS, FINAL_ORDER_PLACEHOLDERS, rows)
+
+        connection.commit()
+        return None
+
+    except Exception as err:
+        logger_database.error(f"Error inserting {len(orders)} final orders:{err}")
         return err
 
     finally:
@@ -497,11 +812,12 @@ def insert_inventory_value(inventory):
         Exception: If there is an error inserting the row into the database.
 
     """
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
         
-        current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         current_unix_timestamp = int(time.time())
+        current_timestamp = _now_str(current_unix_timestamp)
         insert_query = """
             INSERT INTO inventory_values (exchange_name, base_symbol, quote_symbol, quote, base, inventory, price, quote_price, 
                 created_at, updated_at, time_stamp)
@@ -521,6 +837,253 @@ def insert_inventory_value(inventory):
     finally:
         close_connection(connection, cursor)
 
+# The upsert needs migrations/001_volume_snapshots_uq_snap.sql; without it writes fall back to SELECT-then-write
+VOLUME_SNAPSHOT_UNIQUE_COLUMNS = ("strategy_name", "exchange", "base_symbol", "quote_symbol", "time_stamp")
+VOLUME_SNAPSHOT_UPSERT_COLUMNS = """(time_stamp, strategy_name, exchange, base_symbol, quote_symbol, price, quote_price, 
+                    base_volume, quote_volume, usd_volume, created_at, updated_at)"""
+VOLUME_SNAPSHOT_UPSERT_PLACEHOLDERS = "(" + ", ".join(["%s"] * 12) + ")"
+VOLUME_SNAPSHOT_UPSERT_UPDATE = """ON DUPLICATE KEY UPDATE
+                    price = VALUES(price), quote_price = VALUES(quote_price),
+                    base_volume = base_volume + VALUES(base_volume),
+                    quote_volume = quote_volume + VALUES(quote_volume),
+                    usd_volume = usd_volume + VALUES(usd_volume),
+                    updated_at = VALUES(updated_at)"""
+
+WASH_VOLUME_HOUR_TTL = 86400
+# End (exclusive, unix seconds) of the hours already materialised in volume_snapshots_hourly
+VOLUME_HOURLY_WATERMARK_KEY = "vs_hourly:watermark"
+# Hours newer than this may still receive late snapshots and are never cached
+WASH_VOLUME_SETTLE_SEC = 300
+# wv: keys of settled market-hours written to after settling; rollup_volume_snapshots_hourly recomputes them
+VOLUME_HOURLY_DIRTY_KEY = "vs_hourly:dirty"
+VOLUME_HOURLY_REPAIR_BATCH = 1000
+
+def _wash_volume_hour_key(exchange, base_symbol, quote_symbol, hour):
+    """
+    Redis hash holding the cached wash volume of one market-hour, one field per strategy set.
+    """
+    return f"wv:{exchange}:{base_symbol}:{quote_symbol}:{hour}"
+
+def _invalidate_settled_volume_hours(snapshots):
+    """
+    Drops the cached wash volume of every settled hour the given snapshots were just written to and
+    marks those market-hours dirty so the hourly rollup recomputes them. Must run after the write is
+    committed; snapshots for hours that are not settled yet are skipped because _sum_volume_snapshots_hourly
+    never caches those and the rollup has not reached them.
+    """
+    settled_end_hour = (int(time.time()) - WASH_VOLUME_SETTLE_SEC) // 3600
+    keys = {_wash_volume_hour_key(snapshot['exchange'], snapshot['base_symbol'], snapshot['quote_symbol'],
+                                  int(snapshot['time_stamp']) // 3600)
+            for snapshot in snapshots if int(snapshot['time_stamp']) // 3600 < settled_end_hour}
+    if not keys:
+        return
+    try:
+        pipe = r.pipeline()
+        pipe.delete(*keys)
+        pipe.sadd(VOLUME_HOURLY_DIRTY_KEY, *keys)
+        pipe.execute()
+    except Exception as err:
+        logger_database.error(f"Error invalidating wash volume cache {sorted(keys)}: {err}")
+
+def _volume_snapshot_row(snapshot):
+    """
+    Orders a snapshot dict as the VOLUME_SNAPSHOT_UPSERT_COLUMNS values.
+    """
+    return (snapshot['time_stamp'], snapshot['strategy_name'], snapshot['exchange'], snapshot['base_symbol'],
+            snapshot['quote_symbol'], snapshot['price'], snapshot['quote_price'], snapshot['base_volume'],
+            snapshot['quote_volume'], snapshot['usd_volume'], snapshot['created_at'], snapshot['updated_at'])
+
+VOLUME_SNAPSHOT_LOCK_MS = 5000
+VOLUME_SNAPSHOT_LOCK_WAIT = 2
+
+# Only delete the lock if we still own it
+_release_lock_script = r.register_script(
+    "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+)
+
+def _acquire_lock(lock_key, ttl_ms=VOLUME_SNAPSHOT_LOCK_MS, wait=VOLUME_SNAPSHOT_LOCK_WAIT):
+    """
+    Takes a Redis lock with SET NX PX, retrying for up to `wait` seconds.
+
+    Returns:
+        str or None: The owner token, or None if the lock was not obtained.
+    """
+    token = uuid.uuid4().hex
+    deadline = time.time() + wait
+    try:
+        while True:
+            if r.set(lock_key, token, nx=True, px=ttl_ms):
+                return token
+            if time.time() >= deadline:
+                return None
+            time.sleep(0.01)
+    except Exception as err:
+        logger_database.error(f"Error acquiring lock {lock_key}: {err}")
+        return None
+
+def _release_lock(lock_key, token):
+    if token is None:
+        return
+    try:
+        _release_lock_script(keys=[lock_key], args=[token])
+    except Exception as err:
+        logger_database.error(f"Error releasing lock {lock_key}: {err}")
+
+# None until checked; set once per process by _volume_snapshot_upsert_enabled
+_volume_snapshot_has_unique_key = None
+
+def _volume_snapshot_upsert_enabled(cursor):
+    """
+    Tells whether volume_snapshots has a unique key on VOLUME_SNAPSHOT_UNIQUE_COLUMNS, which
+    INSERT ... ON DUPLICATE KEY UPDATE needs to add to an existing row instead of inserting a duplicate.
+    The answer is remembered for the process; a failed lookup is not remembered and counts as "no key".
+    """
+    global _volume_snapshot_has_unique_key
+    if _volume_snapshot_has_unique_key is None:
+        try:
+            cursor.execute("""SELECT INDEX_NAME, GROUP_CONCAT(COLUMN_NAME)
+                              FROM information_schema.STATISTICS
+                              WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'volume_snapshots' AND NON_UNIQUE = 0
+                              GROUP BY INDEX_NAME""")
+            unique_keys = cursor.fetchall()
+        except Exception as err:
+            logger_database.error(f"Error reading volume_snapshots indexes: {err}")
+            return False
+        _volume_snapshot_has_unique_key = any(set(columns.split(",")) == set(VOLUME_SNAPSHOT_UNIQUE_COLUMNS)
+                                              for _, columns in unique_keys)
+        if not _volume_snapshot_has_unique_key:
+            logger_database.warning("volume_snapshots has no unique key on %s, using SELECT-then-write; "
+                                    "apply migrations/001_volume_snapshots_uq_snap.sql", VOLUME_SNAPSHOT_UNIQUE_COLUMNS)
+    return _volume_snapshot_has_unique_key
+
+VOLUME_SNAPSHOT_CACHE_TTL = 3600
+
+def _volume_snapshot_cache_key(snapshot):
+    return f"vs:{snapshot['strategy_name']}:{snapshot['exchange']}:{snapshot['base_symbol']}:{snapshot['quote_symbol']}"
+
+def _cache_volume_snapshot(cache_key, row_id, time_stamp):
+    """
+    Remembers the id and time_stamp of the newest volume snapshot row for a key.
+    """
+    try:
+        pipe = r.pipeline()
+        pipe.hset(cache_key, mapping={'id': row_id, 'time_stamp': time_stamp})
+        pipe.expire(cache_key, VOLUME_SNAPSHOT_CACHE_TTL)
+        pipe.execute()
+    except Exception as err:
+        logger_database.error(f"Error writing cache {cache_key}: {err}")
+
+def _update_volume_snapshot_row(cursor, snapshot, row_id):
+    cursor.execute("""UPDATE volume_snapshots 
+                      SET price = %s, quote_price = %s, base_volume = base_volume + %s, 
+                          quote_volume = quote_volume + %s, usd_volume = usd_volume + %s, updated_at = %s
+                      WHERE id = %s""",
+                   (snapshot['price'], snapshot['quote_price'], snapshot['base_volume'], snapshot['quote_volume'],
+                    snapshot['usd_volume'], snapshot['updated_at'], row_id))
+
+def _insert_volume_snapshot_row(cursor, snapshot):
+    cursor.execute(f"INSERT INTO volume_snapshots {VOLUME_SNAPSHOT_UPSERT_COLUMNS} VALUES {VOLUME_SNAPSHOT_UPSERT_PLACEHOLDERS}",
+                   _volume_snapshot_row(snapshot))
+    return cursor.lastrowid
+
+def _write_volume_snapshot_by_select(cursor, snapshot):
+    """
+    SELECT-then-write for a schema without uq_snap: adds the volumes to the row with the same
+    (strategy, exchange, base, quote, time_stamp), or inserts one. The caller holds the market's lock.
+
+    The (id, time_stamp) of the newest row per market is kept in the Redis hash vs:{strategy}:{exchange}:{base}:{quote},
+    so the steady-state snapshot (same bucket as the newest row, or a newer one) needs no SELECT. Every
+    fallback write goes through here under the lock, which keeps the hash in step with the table.
+
+    Returns:
+        tuple or None: The (id, time_stamp) to cache once the write is committed, or None to leave the cache as is.
+    """
+    time_stamp = int(snapshot['time_stamp'])
+    cache_key = _volume_snapshot_cache_key(snapshot)
+    try:
+        cached = r.hgetall(cache_key)
+    except Exception as err:
+        logger_database.error(f"Error reading cache {cache_key}: {err}")
+        cached = None
+
+    if cached:
+        last_id, last_time_stamp = int(cached['id']), int(cached['time_stamp'])
+    else:
+        cursor.execute("""SELECT id, time_stamp FROM volume_snapshots
+                          WHERE strategy_name = %s AND exchange = %s AND base_symbol = %s AND quote_symbol = %s
+                          ORDER BY time_stamp DESC, id DESC LIMIT 1""",
+                       (snapshot['strategy_name'], snapshot['exchange'], snapshot['base_symbol'], snapshot['quote_symbol']))
+        last_row = cursor.fetchone()
+        if last_row is None:
+            return _insert_volume_snapshot_row(cursor, snapshot), time_stamp
+        last_id, last_time_stamp = int(last_row[0]), int(last_row[1])
+
+    if last_time_stamp < time_stamp:
+        return _insert_volume_snapshot_row(cursor, snapshot), time_stamp
+    if last_time_stamp == time_stamp:
+        _update_volume_snapshot_row(cursor, snapshot, last_id)
+        # rowcount 0: the cached row is gone, e.g. merged away by the uq_snap migration
+        if cursor.rowcount:
+            return None if cached else (last_id, last_time_stamp)
+
+    # An older bucket, or a cached row that no longer exists: look the bucket up directly
+    cursor.execute("""SELECT id FROM volume_snapshots
+                      WHERE strategy_name = %s AND exchange = %s AND base_symbol = %s AND quote_symbol = %s AND time_stamp = %s
+                      LIMIT 1""",
+                   (snapshot['strategy_name'], snapshot['exchange'], snapshot['base_symbol'],
+                    snapshot['quote_symbol'], snapshot['time_stamp']))
+    existing_row = cursor.fetchone()
+    if existing_row is None:
+        row_id = _insert_volume_snapshot_row(cursor, snapshot)
+    else:
+        row_id = existing_row[0]
+        _update_volume_snapshot_row(cursor, snapshot, row_id)
+    if last_time_stamp == time_stamp:
+        return row_id, time_stamp
+    return None if cached else (last_id, last_time_stamp)
+
+def _write_volume_snapshots(connection, cursor, snapshots, written=None):
+    """
+    Adds the snapshots to volume_snapshots and commits: one batched upsert when uq_snap exists,
+    otherwise SELECT-then-write and a commit per snapshot, each under the Redis lock
+    vslock:{strategy}:{exchange}:{base}:{quote} so writers of other markets are not blocked.
+
+    Args:
+        written (list, optional): Receives each snapshot once it is committed, so a caller can
+            retry only the rest after an error.
+    """
+    global _volume_snapshot_has_unique_key
+    written = [] if written is None else written
+    try:
+        if _volume_snapshot_upsert_enabled(cursor):
+            _bulk_insert(cursor, "volume_snapshots", VOLUME_SNAPSHOT_UPSERT_COLUMNS, VOLUME_SNAPSHOT_UPSERT_PLACEHOLDERS,
+                         [_volume_snapshot_row(snapshot) for snapshot in snapshots], suffix=VOLUME_SNAPSHOT_UPSERT_UPDATE)
+            connection.commit()
+            written.extend(snapshots)
+            return
+        for snapshot in snapshots:
+            lock_key = (f"vslock:{snapshot['strategy_name']}:{snapshot['exchange']}:"
+                        f"{snapshot['base_symbol']}:{snapshot['quote_symbol']}")
+            lock_token = _acquire_lock(lock_key)
+            if lock_token is None:
+                # Writing unlocked could insert the same bucket twice
+                raise TimeoutError(f"Could not take volume snapshot lock {lock_key}")
+            try:
+                newest = _write_volume_snapshot_by_select(cursor, snapshot)
+                connection.commit()
+                written.append(snapshot)
+                if newest is not None:
+                    _cache_volume_snapshot(_volume_snapshot_cache_key(snapshot), *newest)
+            except _driver.IntegrityError:
+                # uq_snap was added while this process was running: check again on the next write
+                _volume_snapshot_has_unique_key = None
+                _cache_delete(_volume_snapshot_cache_key(snapshot))
+                raise
+            finally:
+                _release_lock(lock_key, lock_token)
+    finally:
+        _invalidate_settled_volume_hours(written)
+
 def insert_volume_snapshots(snapshot):
     """
     Inserts a snapshot into the volume_snapshots table based on the provided snapshot data.
@@ -531,45 +1094,16 @@ def insert_volume_snapshots(snapshot):
 
     Returns:
         None if successful, otherwise returns an error message.
+
+    Note:
+        Shares _write_volume_snapshots with insert_volume_snapshots_v2 and the buffer flush: a single
+        INSERT ... ON DUPLICATE KEY UPDATE when the unique key uq_snap exists, otherwise the original
+        SELECT-then-write, which skips the SELECT via the vs: Redis hash of the newest row per market.
     """
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
-        
-        # current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Prepare the SELECT statement to get the last row based on the 'id' column
-        query = f"""SELECT * 
-                    FROM volume_snapshots 
-                    WHERE strategy_name = '{snapshot['strategy_name']}' AND exchange = '{snapshot['exchange']}' 
-                        AND base_symbol = '{snapshot['base_symbol']}' AND quote_symbol = '{snapshot['quote_symbol']}' 
-                    ORDER BY id DESC LIMIT 1"""
-        
-        # Execute the SELECT statement
-        cursor.execute(query)
-        
-        # Fetch the last row
-        last_row = cursor.fetchone()
-        if last_row is None or int(last_row[4]) < snapshot['time_stamp']:
-            insert_query = """
-                INSERT INTO volume_snapshots (time_stamp, strategy_name, exchange, base_symbol, quote_symbol, price, quote_price, 
-                    base_volume, quote_volume, usd_volume, created_at, updated_at)
-                VALUES ( %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-            cursor.execute(insert_query, (snapshot['time_stamp'], snapshot['strategy_name'], snapshot['exchange'], snapshot['base_symbol'], 
-                                          snapshot['quote_symbol'], snapshot['price'], snapshot['quote_price'], snapshot['base_volume'], 
-                                          snapshot['quote_volume'], snapshot['usd_volume'], snapshot['created_at'], snapshot['updated_at'] ))
-        else: 
-            update_query = """
-                UPDATE volume_snapshots 
-                SET price = %s, quote_price = %s, base_volume = base_volume + %s, 
-                    quote_volume = quote_volume + %s, usd_volume = usd_volume + %s, updated_at = %s
-                WHERE time_stamp = %s AND strategy_name = %s AND exchange = %s AND base_symbol = %s AND quote_symbol = %s
-                """
-            cursor.execute(update_query, (snapshot['price'], snapshot['quote_price'], snapshot['base_volume'], snapshot['quote_volume'], 
-                                          snapshot['usd_volume'], snapshot['updated_at'], snapshot['time_stamp'], snapshot['strategy_name'], 
-                                          snapshot['exchange'], snapshot['base_symbol'], snapshot['quote_symbol']))
-        
-        connection.commit()
+        _write_volume_snapshots(connection, cursor, [snapshot])
         return None
         
     except Exception as err:
@@ -583,83 +1117,342 @@ def insert_volume_snapshots_v2(snapshot):
     """
     Inserts a snapshot into the volume_snapshots table based on the provided snapshot data.
     Handles concurrent updates safely and ensures correct logic for time-independent updates.
+
+    Note:
+        With the unique key uq_snap (strategy_name, exchange, base_symbol, quote_symbol, time_stamp)
+        a single INSERT ... ON DUPLICATE KEY UPDATE adds the volumes to an existing row, and InnoDB's
+        row lock replaces LOCK TABLES; without it the write falls back to SELECT-then-write under a
+        per-market Redis lock.
     """
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
+        _write_volume_snapshots(connection, cursor, [snapshot])
+        return None
+
+    except Exception as err:
+        logger_database.error(f"Error inserting row: {err}")
+        return err
 
-        # Lock the table to prevent race conditions during concurrent updates
-        cursor.execute("LOCK TABLES volume_snapshots WRITE")
+    finally:
+        close_connection(connection, cursor)
 
-        # Check for an existing record with matching keys and time_stamp
-        query = f"""
-            SELECT * 
-            FROM volume_snapshots 
-            WHERE strategy_name = %s AND exchange = %s 
-                AND base_symbol = %s AND quote_symbol = %s 
-                AND time_stamp = %s
-        """
+VOLUME_SNAPSHOT_BUFFER_DIRTY_KEY = "vsbuf:dirty"
+VOLUME_SNAPSHOT_BUFFER_TTL = 3600
+VOLUME_SNAPSHOT_FLUSH_BATCH = 1000
+_volume_snapshot_flusher = None
+_volume_rollup_scheduler = None
 
-        cursor.execute(query, (
-            snapshot['strategy_name'],
-            snapshot['exchange'],
-            snapshot['base_symbol'],
-            snapshot['quote_symbol'],
-            snapshot['time_stamp']
-        ))
+def buffer_volume_snapshot(snapshot):
+    """
+    Accumulates a snapshot in Redis instead of writing it to MySQL straight away.
+    Volumes are added with HINCRBYFLOAT per (strategy, exchange, base, quote, time_stamp) bucket,
+    prices and updated_at keep the latest value. flush_volume_snapshot_buffer writes the buckets out.
 
-        existing_row = cursor.fetchone()
+    Args:
+        snapshot (dict): Same keys as insert_volume_snapshots_v2 expects.
 
-        if existing_row is None:
-            # Insert a new snapshot if no matching record exists
-            insert_query = """
-                INSERT INTO volume_snapshots (time_stamp, strategy_name, exchange, base_symbol, quote_symbol, price, quote_price, 
-                    base_volume, quote_volume, usd_volume, created_at, updated_at)
-                VALUES ( %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            cursor.execute(insert_query, (
-                snapshot['time_stamp'],
-                snapshot['strategy_name'],
-                snapshot['exchange'],
-                snapshot['base_symbol'],
-                snapshot['quote_symbol'],
-                snapshot['price'],
-                snapshot['quote_price'],
-                snapshot['base_volume'],
-                snapshot['quote_volume'],
-                snapshot['usd_volume'],
-                snapshot['created_at'],
-                snapshot['updated_at']
-            ))
+    Returns:
+        None if successful, otherwise returns an error message.
+    """
+    try:
+        key = (f"vsbuf:{snapshot['strategy_name']}:{snapshot['exchange']}:{snapshot['base_symbol']}:"
+               f"{snapshot['quote_symbol']}:{snapshot['time_stamp']}")
+        pipe = r.pipeline(transaction=True)
+        pipe.hsetnx(key, 'created_at', str(snapshot['created_at']))
+        pipe.hset(key, mapping={
+            'time_stamp': snapshot['time_stamp'],
+            'strategy_name': snapshot['strategy_name'],
+            'exchange': snapshot['exchange'],
+            'base_symbol': snapshot['base_symbol'],
+            'quote_symbol': snapshot['quote_symbol'],
+            'price': snapshot['price'],
+            'quote_price': snapshot['quote_price'],
+            'updated_at': str(snapshot['updated_at']),
+        })
+        pipe.hincrbyfloat(key, 'base_volume', float(snapshot['base_volume']))
+        pipe.hincrbyfloat(key, 'quote_volume', float(snapshot['quote_volume']))
+        pipe.hincrbyfloat(key, 'usd_volume', float(snapshot['usd_volume']))
+        pipe.expire(key, VOLUME_SNAPSHOT_BUFFER_TTL)
+        pipe.sadd(VOLUME_SNAPSHOT_BUFFER_DIRTY_KEY, key)
+        pipe.execute()
+        return None
+    except Exception as err:
+        logger_database.error(f"Error buffering volume snapshot: {err}")
+        return err
+
+def flush_volume_snapshot_buffer():
+    """
+    Writes the buffered volume snapshot buckets to MySQL with batched INSERT ... ON DUPLICATE KEY UPDATE
+    (row by row when uq_snap is missing, see _write_volume_snapshots).
+
+    Returns:
+        int or Exception: The number of buckets flushed, or an Exception if an error occurs.
+    """
+    connection = cursor = None
+    buckets = []
+    written = []
+    try:
+        keys = r.spop(VOLUME_SNAPSHOT_BUFFER_DIRTY_KEY, VOLUME_SNAPSHOT_FLUSH_BATCH)
+        if not keys:
+            return 0
+
+        # Read and clear each bucket atomically so increments arriving meanwhile start a new bucket
+        pipe = r.pipeline(transaction=True)
+        for key in keys:
+            pipe.hgetall(key)
+            pipe.delete(key)
+        results = pipe.execute()
+
+        buckets = [bucket for bucket in results[0::2] if bucket]
+        if not buckets:
+            return 0
+
+        connection, cursor = get_connection()
+        _write_volume_snapshots(connection, cursor, buckets, written)
+        return len(buckets)
+
+    except Exception as err:
+        logger_database.error(f"Error flushing volume snapshots: {err}")
+        # Put the drained buckets that were not committed back so the next flush retries them
+        committed = {id(bucket) for bucket in written}
+        for bucket in buckets:
+            if id(bucket) not in committed:
+                buffer_volume_snapshot(bucket)
+        return err
+
+    finally:
+        close_connection(connection, cursor)
+
+def start_volume_snapshot_flusher(interval=5):
+    """
+    Starts a daemon thread that calls flush_volume_snapshot_buffer every interval seconds.
+    Calling it again while the thread is running is a no-op.
+    """
+    global _volume_snapshot_flusher
+    if _volume_snapshot_flusher is not None and _volume_snapshot_flusher.is_alive():
+        return _volume_snapshot_flusher
+
+    def _loop():
+        while True:
+            time.sleep(interval)
+            flush_volume_snapshot_buffer()
+
+    _volume_snapshot_flusher = threading.Thread(target=_loop, name="volume-snapshot-flusher", daemon=True)
+    _volume_snapshot_flusher.start()
+    return _volume_snapshot_flusher
+
+def _volume_snapshot_filter(list_strategy, exchange, base_symbol, quote_symbol, from_time, to_time=None,
+                            time_column="time_stamp"):
+    """
+    Builds the WHERE clause and parameters shared by the wash volume queries.
+    """
+    where = f"exchange = %s AND base_symbol = %s AND quote_symbol = %s AND {time_column} >= %s"
+    params = [exchange, base_symbol, quote_symbol, from_time]
+    if to_time is not None:
+        where += f" AND {time_column} <= %s"
+        params.append(to_time)
+    if list_strategy:
+        where += " AND (" + " OR ".join(["strategy_name LIKE %s"] * len(list_strategy)) + ")"
+        params.extend(f"%{strategy_name.lower()}%" for strategy_name in list_strategy)
+    return where, params
+
+def _sum_volume_snapshots(cursor, list_strategy, exchange, base_symbol, quote_symbol, from_time, to_time=None):
+    """
+    Sums usd_volume in MySQL for rows matching any of the strategies (LIKE, case-insensitive pattern)
+    and the given market/time range. An empty strategy list matches every strategy.
+
+    Index: ALTER TABLE volume_snapshots ADD INDEX idx_vs_lookup
+               (exchange, base_symbol, quote_symbol, time_stamp, strategy_name, usd_volume)
+    makes this a covering range scan (EXPLAIN shows "Using index"); the leading %...% LIKE
+    cannot seek, but strategy_name is filtered from the index entries without touching the rows.
+
+    Returns:
+        float: The summed usd_volume, 0 when no rows match.
+    """
+    where, params = _volume_snapshot_filter(list_strategy, exchange, base_symbol, quote_symbol, from_time, to_time)
+    cursor.execute(f"SELECT COALESCE(SUM(usd_volume), 0) FROM volume_snapshots WHERE {where}", params)
+    return float(cursor.fetchone()[0])
+
+def _contiguous_hour_runs(hours):
+    """
+    Splits a sorted list of hour numbers into [start, stop) runs of consecutive hours.
+    """
+    runs = []
+    for hour in hours:
+        if runs and runs[-1][1] == hour:
+            runs[-1][1] = hour + 1
         else:
-            # Update the existing snapshot if a matching record exists
-            update_query = """
-                UPDATE volume_snapshots 
-                SET price = %s, quote_price = %s, base_volume = base_volume + %s, 
-                    quote_volume = quote_volume + %s, usd_volume = usd_volume + %s, updated_at = %s
-                WHERE id = %s
-            """
-            cursor.execute(update_query, (
-                snapshot['price'],
-                snapshot['quote_price'],
-                snapshot['base_volume'],
-                snapshot['quote_volume'],
-                snapshot['usd_volume'],
-                snapshot['updated_at'],
-                existing_row[0]  # Use the primary key ID of the existing row
-            ))
+            runs.append([hour, hour + 1])
+    return [tuple(run) for run in runs]
 
+def _sum_volume_snapshots_hourly(cursor, list_strategy, exchange, base_symbol, quote_symbol, from_time, to_time=None):
+    """
+    Same result as _sum_volume_snapshots, but the sum of every complete, settled hour inside the
+    range is cached in Redis (hash wv:{exchange}:{base}:{quote}:{hour}, field = strategy set). Only the
+    partial edge hours and uncached hours are read from MySQL; uncached hours come back in one GROUP BY.
+    A snapshot written late into a settled hour deletes that hour's hash and marks it dirty, see
+    _invalidate_settled_volume_hours; dirty hours are read from raw rows until the rollup has recomputed them.
+    Falls back to the plain query when the bounds are not unix-second integers.
+    """
+    if not isinstance(from_time, int) or not (to_time is None or isinstance(to_time, int)):
+        return _sum_volume_snapshots(cursor, list_strategy, exchange, base_symbol, quote_symbol, from_time, to_time)
+
+    first_hour = -(-from_time // 3600)
+    end_hour = (int(time.time()) - WASH_VOLUME_SETTLE_SEC) // 3600
+    if to_time is not None:
+        end_hour = min(end_hour, (to_time + 1) // 3600)
+    if end_hour <= first_hour:
+        return _sum_volume_snapshots(cursor, list_strategy, exchange, base_symbol, quote_symbol, from_time, to_time)
+
+    strategies_key = ",".join(sorted({strategy_name.lower() for strategy_name in list_strategy})) or "*"
+    hours = range(first_hour, end_hour)
+    keys = [_wash_volume_hour_key(exchange, base_symbol, quote_symbol, hour) for hour in hours]
+    try:
+        pipe = r.pipeline()
+        for key in keys:
+            pipe.hget(key, strategies_key)
+        for key in keys:
+            pipe.sismember(VOLUME_HOURLY_DIRTY_KEY, key)
+        pipe.get(VOLUME_HOURLY_WATERMARK_KEY)
+        cached = pipe.execute()
+    except Exception as err:
+        logger_database.error(f"Error reading wash volume cache: {err}")
+        return _sum_volume_snapshots(cursor, list_strategy, exchange, base_symbol, quote_symbol, from_time, to_time)
+    rollup_end_hour = int(cached.pop() or 0) // 3600
+    dirty = {hour for hour, is_dirty in zip(hours, cached[len(keys):]) if is_dirty}
+    cached = cached[:len(keys)]
+
+    wash_volume = sum(float(value) for value in cached if value is not None)
+    missing = [hour for hour, value in zip(hours, cached) if value is None]
+    if missing:
+        hour_sums = {}
+        # Hours already in volume_snapshots_hourly are summed from the rollup, the rest from raw rows
+        rolled = [hour for hour in missing if hour < rollup_end_hour and hour not in dirty]
+        raw = [hour for hour in missing if hour >= rollup_end_hour or hour in dirty]
+        if rolled:
+            where, params = _volume_snapshot_filter(list_strategy, exchange, base_symbol, quote_symbol,
+                                                    rolled[0] * 3600, rolled[-1] * 3600, time_column="hour")
+            where += " AND hour IN (" + ", ".join(["%s"] * len(rolled)) + ")"
+            params.extend(hour * 3600 for hour in rolled)
+            cursor.execute(f"""SELECT hour DIV 3600, COALESCE(SUM(usd_volume_sum), 0) 
+                               FROM volume_snapshots_hourly WHERE {where} GROUP BY hour""", params)
+            hour_sums.update((int(hour), float(total)) for hour, total in cursor.fetchall())
+        if raw:
+            # One range per run of consecutive hours, so a single dirty hour does not scan the whole span
+            runs = _contiguous_hour_runs(raw)
+            where, params = _volume_snapshot_filter(list_strategy, exchange, base_symbol, quote_symbol,
+                                                    raw[0] * 3600, (raw[-1] + 1) * 3600 - 1)
+            where += " AND (" + " OR ".join(["(time_stamp >= %s AND time_stamp < %s)"] * len(runs)) + ")"
+            for start_hour, stop_hour in runs:
+                params.extend((start_hour * 3600, stop_hour * 3600))
+            cursor.execute(f"""SELECT time_stamp DIV 3600 AS hour, COALESCE(SUM(usd_volume), 0) 
+                               FROM volume_snapshots WHERE {where} GROUP BY hour""", params)
+            hour_sums.update((int(hour), float(total)) for hour, total in cursor.fetchall())
+        try:
+            pipe = r.pipeline()
+            for hour in missing:
+                pipe.hset(keys[hour - first_hour], strategies_key, hour_sums.get(hour, 0.0))
+                pipe.expire(keys[hour - first_hour], WASH_VOLUME_HOUR_TTL)
+            pipe.execute()
+        except Exception as err:
+            logger_database.error(f"Error writing wash volume cache: {err}")
+        wash_volume += sum(hour_sums.get(hour, 0.0) for hour in missing)
+
+    # Partial hour before the first full hour, and everything from the first unsettled hour on
+    if from_time < first_hour * 3600:
+        wash_volume += _sum_volume_snapshots(cursor, list_strategy, exchange, base_symbol, quote_symbol,
+                                             from_time, first_hour * 3600 - 1)
+    if to_time is None or end_hour * 3600 <= to_time:
+        wash_volume += _sum_volume_snapshots(cursor, list_strategy, exchange, base_symbol, quote_symbol,
+                                             end_hour * 3600, to_time)
+    return wash_volume
+
+def rollup_volume_snapshots_hourly():
+    """
+    Materialises settled hours of volume_snapshots into volume_snapshots_hourly. Meant to be run
+    every few minutes by a scheduler; each run recomputes the hours since the last rolled-up one,
+    so re-running it is harmless. Market-hours below the watermark that received late snapshots
+    (VOLUME_HOURLY_DIRTY_KEY) are recomputed as well, and their wv: cache is dropped afterwards.
+
+    The table is created by migrations/002_volume_snapshots_hourly.sql; start_volume_rollup_scheduler
+    runs this in the background.
+
+    Returns:
+        int or Exception: The new watermark (end of the last rolled-up hour), or an Exception if an error occurs.
+    """
+    connection = cursor = None
+    dirty_keys = []
+    try:
+        # Popped before recomputing: a late write landing meanwhile marks its hour dirty again
+        dirty_keys = r.spop(VOLUME_HOURLY_DIRTY_KEY, VOLUME_HOURLY_REPAIR_BATCH) or []
+        connection, cursor = get_connection()
+        settled_end = (int(time.time()) - WASH_VOLUME_SETTLE_SEC) // 3600 * 3600
+        cursor.execute("SELECT COALESCE(MAX(hour) + 3600, 0) FROM volume_snapshots_hourly")
+        watermark = int(cursor.fetchone()[0])
+        if watermark < settled_end:
+            cursor.execute("""
+                INSERT INTO volume_snapshots_hourly (exchange, base_symbol, quote_symbol, strategy_name, hour, usd_volume_sum)
+                SELECT exchange, base_symbol, quote_symbol, strategy_name, time_stamp DIV 3600 * 3600 AS hour, SUM(usd_volume)
+                FROM volume_snapshots
+                WHERE time_stamp >= %s AND time_stamp < %s
+                GROUP BY exchange, base_symbol, quote_symbol, strategy_name, hour
+                ON DUPLICATE KEY UPDATE usd_volume_sum = VALUES(usd_volume_sum)
+            """, (watermark, settled_end))
+            watermark = settled_end
+        for key in dirty_keys:
+            exchange, base_symbol, quote_symbol, hour = key[len("wv:"):].rsplit(":", 3)
+            hour_start = int(hour) * 3600
+            cursor.execute("""
+                INSERT INTO volume_snapshots_hourly (exchange, base_symbol, quote_symbol, strategy_name, hour, usd_volume_sum)
+                SELECT exchange, base_symbol, quote_symbol, strategy_name, %s, SUM(usd_volume)
+                FROM volume_snapshots
+                WHERE exchange = %s AND base_symbol = %s AND quote_symbol = %s AND time_stamp >= %s AND time_stamp < %s
+                GROUP BY exchange, base_symbol, quote_symbol, strategy_name
+                ON DUPLICATE KEY UPDATE usd_volume_sum = VALUES(usd_volume_sum)
+            """, (hour_start, exchange, base_symbol, quote_symbol, hour_start, hour_start + 3600))
         connection.commit()
-        return None
+        if dirty_keys:
+            # Readers may have cached the old rollup value while the hour was being recomputed
+            _cache_delete(*dirty_keys)
+        _cache_set(VOLUME_HOURLY_WATERMARK_KEY, watermark, ttl=WASH_VOLUME_HOUR_TTL)
+        return watermark
 
     except Exception as err:
-        logger_database.error(f"Error inserting row: {err}")
+        logger_database.error(f"Error rolling up volume snapshots: {err}")
+        if dirty_keys:
+            try:
+                r.sadd(VOLUME_HOURLY_DIRTY_KEY, *dirty_keys)
+            except Exception as redis_err:
+                logger_database.error(f"Error re-queueing dirty volume hours: {redis_err}")
         return err
 
     finally:
-        # Unlock the table to allow other transactions
-        cursor.execute("UNLOCK TABLES")
         close_connection(connection, cursor)
 
+VOLUME_ROLLUP_LOCK_KEY = "vs_hourly:rollup_lock"
+
+def start_volume_rollup_scheduler(interval=300):
+    """
+    Starts a daemon thread that calls rollup_volume_snapshots_hourly every interval seconds.
+    The run is guarded by a Redis lock that lives for one interval, so when several workers start
+    the scheduler only one of them rolls up per interval. Calling it again while the thread is
+    running is a no-op.
+    """
+    global _volume_rollup_scheduler
+    if _volume_rollup_scheduler is not None and _volume_rollup_scheduler.is_alive():
+        return _volume_rollup_scheduler
+
+    def _loop():
+        while True:
+            if _acquire_lock(VOLUME_ROLLUP_LOCK_KEY, ttl_ms=interval * 1000, wait=0):
+                rollup_volume_snapshots_hourly()
+            time.sleep(interval)
+
+    _volume_rollup_scheduler = threading.Thread(target=_loop, name="volume-rollup-scheduler", daemon=True)
+    _volume_rollup_scheduler.start()
+    return _volume_rollup_scheduler
+
 def calculate_volume_snapshots(list_strategy, exchange, base_symbol, quote_symbol, from_time):
     """
     Calculate the total wash volume for a given list of strategies, exchange, base symbol, quote symbol, and from time.
@@ -674,9 +1467,9 @@ def calculate_volume_snapshots(list_strategy, exchange, base_symbol, quote_symbo
     Returns:
         float or Exception: The total wash volume if successful, or an Exception object if an error occurs.
     """
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
-        wash_volume = 0
         
         if isinstance(list_strategy, str):
             list_strategy = [list_strategy]
@@ -685,32 +1478,9 @@ def calculate_volume_snapshots(list_strategy, exchange, base_symbol, quote_symbo
         else:
             raise ValueError("strategy_name must be a string or a list.")
         
-        if len(list_strategy) == 0:
-            query = f"""SELECT * FROM volume_snapshots 
-                        WHERE exchange = '{exchange}' AND base_symbol = '{base_symbol}' 
-                            AND quote_symbol = '{quote_symbol}' AND time_stamp >= '{from_time}' 
-                        ORDER BY id DESC"""
-            # Execute the SELECT statement
-            cursor.execute(query)
-            list_volume_snapshots = cursor.fetchall()
-
-            for volume_snapshot in list_volume_snapshots:
-                usd_volume = volume_snapshot[-1]
-                wash_volume += float(usd_volume)
-        else:
-            for strategy_name in list_strategy:
-                # Prepare the SELECT statement to get the last row based on the 'id' column
-                query = f"""SELECT * FROM volume_snapshots 
-                            WHERE strategy_name LIKE '%{strategy_name.lower()}%' AND exchange = '{exchange}'
-                                AND base_symbol = '{base_symbol}' AND quote_symbol = '{quote_symbol}' AND time_stamp >= '{from_time}' 
-                            ORDER BY id DESC"""
-                # Execute the SELECT statement
-                cursor.execute(query)
-                list_volume_snapshots = cursor.fetchall()
-                for volume_snapshot in list_volume_snapshots:
-                    usd_volume = volume_snapshot[-1]
-                    wash_volume += float(usd_volume)
-                logger_database.info(f"wash volume of {strategy_name} - {exchange} - {base_symbol} - {quote_symbol} - {from_time}: {wash_volume}")
+        wash_volume = _sum_volume_snapshots_hourly(cursor, list_strategy, exchange, base_symbol, quote_symbol, from_time)
+        if list_strategy:
+            logger_database.info("wash volume of %s - %s - %s - %s - %s: %s", list_strategy, exchange, base_symbol, quote_symbol, from_time, wash_volume)
         return wash_volume
         
     except Exception as err:
@@ -730,40 +1500,17 @@ def calculate_volume_snapshots_v2(list_strategy, exchange, base_symbol, quote_sy
         base_symbol (str): The base symbol.
         quote_symbol (str): The quote symbol.
         from_time (str): The starting time in the format 'YYYY-MM-DD HH:MM:SS'.
+        to_time (str): The end time (inclusive) in the same format.
         
     Returns:
         float or Exception: The total wash volume if successful, or an Exception object if an error occurs.
     """
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
-        cursor = connection.cursor()
-        wash_volume = 0
-        if len(list_strategy) == 0:
-            query = f"""SELECT * FROM volume_snapshots 
-                        WHERE exchange = '{exchange}' AND base_symbol = '{base_symbol}' 
-                            AND quote_symbol = '{quote_symbol}' AND time_stamp >= '{from_time}' AND time_stamp <= '{to_time}' 
-                        ORDER BY id DESC"""
-            # Execute the SELECT statement
-            cursor.execute(query)
-            list_volume_snapshots = cursor.fetchall()
-            for volume_snapshot in list_volume_snapshots:
-                usd_volume = volume_snapshot[-1]
-                wash_volume += float(usd_volume)
-        else:
-            for strategy_name in list_strategy:
-                # Prepare the SELECT statement to get the last row based on the 'id' column
-                query = f"""SELECT * FROM volume_snapshots 
-                            WHERE strategy_name LIKE '%{strategy_name.lower()}%' AND exchange = '{exchange}'
-                                AND base_symbol = '{base_symbol}' AND quote_symbol = '{quote_symbol}' AND time_stamp >= '{from_time}' AND time_stamp <= '{to_time}' 
-                            ORDER BY id DESC"""
-                # Execute the SELECT statement
-                cursor.execute(query)
-                list_volume_snapshots = cursor.fetchall()
-
-                for volume_snapshot in list_volume_snapshots:
-                    usd_volume = volume_snapshot[-1]
-                    wash_volume += float(usd_volume)
-                logger_database.info(f"wash volume of {strategy_name} - {exchange} - {base_symbol} - {quote_symbol} - {from_time}: {wash_volume}")
+        wash_volume = _sum_volume_snapshots_hourly(cursor, list_strategy, exchange, base_symbol, quote_symbol, from_time, to_time)
+        if list_strategy:
+            logger_database.info("wash volume of %s - %s - %s - %s - %s: %s", list_strategy, exchange, base_symbol, quote_symbol, from_time, wash_volume)
         return wash_volume
         
     except Exception as err:
@@ -797,11 +1544,12 @@ def insert_error_max_eat(order):
         Exception: If there is an error inserting the row.
 
     """
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
         
         current_unix_timestamp = int(time.time())
-        current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        current_timestamp = _now_str(current_unix_timestamp)
         
         insert_query = """
             INSERT INTO error_max_eats (order_id, exchange, strategy_name, api_key, account_id, base_symbol, exchange_symbol, 
@@ -823,6 +1571,23 @@ def insert_error_max_eat(order):
     finally:
         close_connection(connection, cursor)
     
+PARAM_CACHE_TTL = 300
+# In-process copy of param content in front of Redis: {param_id: (expires_at, content)}
+PARAM_LOCAL_CACHE_TTL = 30
+_param_local_cache = {}
+
+def invalidate_param_cache(param_id):
+    """
+    Drops the cached content of a param after it has been edited.
+    """
+    _param_local_cache.pop(param_id, None)
+    _cache_delete(f"param:{param_id}")
+
+def _remember_param(param_id, content):
+    if len(_param_local_cache) >= 1024:
+        _param_local_cache.clear()
+    _param_local_cache[param_id] = (time.time() + PARAM_LOCAL_CACHE_TTL, content)
+
 def fetch_param_by_id(param_id):
     """
     Fetches a parameter from the database by its ID.
@@ -835,13 +1600,34 @@ def fetch_param_by_id(param_id):
 
     Raises:
         mysql.connector.Error: If there is an error executing the SQL query.
+
+    Note:
+        The raw content is cached in-process for PARAM_LOCAL_CACHE_TTL seconds and in Redis under
+        param:{id} for PARAM_CACHE_TTL seconds. Anything that edits params.content should call
+        invalidate_param_cache(param_id). Each call returns a freshly parsed dict, so callers may mutate it.
     """
+    local = _param_local_cache.get(param_id)
+    if local is not None and local[0] > time.time():
+        return json.loads(local[1])
+
+    cache_key = f"param:{param_id}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        _remember_param(param_id, cached)
+        return json.loads(cached)
+
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
         select_query = """SELECT content FROM params WHERE id = %s and deleted_at IS NULL"""
         cursor.execute(select_query, (param_id,))
         result = cursor.fetchone()
         if result is not None and len(result) > 0:
+            try:
+                r.setex(cache_key, PARAM_CACHE_TTL, result[0])
+            except Exception as err:
+                logger_database.error(f"Error writing cache {cache_key}: {err}")
+            _remember_param(param_id, result[0])
             result = json.loads(result[0])
             return result
         return None
@@ -852,6 +1638,26 @@ def fetch_param_by_id(param_id):
     finally:
         close_connection(connection, cursor)
 
+ERROR_LOG_DEDUP_SEC = 60
+
+def _is_repeated_error(file_name, line, content):
+    """
+    Counts an error in Redis and reports whether the same (file_name, line, content)
+    was already logged in the last ERROR_LOG_DEDUP_SEC seconds.
+    """
+    digest = hashlib.md5(f"{file_name}:{line}:{content}".encode()).hexdigest()
+    key = f"errlog:{digest}"
+    try:
+        # Create the counter with its TTL and increment it in one round-trip
+        pipe = r.pipeline(transaction=True)
+        pipe.set(key, 0, ex=ERROR_LOG_DEDUP_SEC, nx=True)
+        pipe.incr(key)
+        count = pipe.execute()[1]
+        return count > 1
+    except Exception as err:
+        logger_database.error(f"Error counting error log {key}: {err}")
+        return False
+
 def insert_error_logger(file_name, line, content):
     """
     Inserts an error_logger record into the database.
@@ -862,16 +1668,20 @@ def insert_error_logger(file_name, line, content):
         content (str): The content of the error.
 
     Returns:
-        None: If the record is successfully inserted.
+        None: If the record is successfully inserted, or skipped because the same error
+        was already logged in the last ERROR_LOG_DEDUP_SEC seconds.
 
     Raises:
         Exception: If there is an error inserting the row.
 
     """
+    if _is_repeated_error(file_name, line, content):
+        return None
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
         
-        current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        current_timestamp = _now_str()
         
         insert_query = """
             INSERT INTO error_loggers (file_name, line, content, created_at, updated_at)
@@ -890,11 +1700,12 @@ def insert_error_logger(file_name, line, content):
         close_connection(connection, cursor)
         
 def insert_assets_snapshot(base_symbol, contents):
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
         
-        current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         current_unix_timestamp = int(time.time())
+        current_timestamp = _now_str(current_unix_timestamp)
         insert_query = """
             INSERT INTO assets_snap_shot (base_symbol, contents, created_at, updated_at, time_stamp)
             VALUES (%s, %s, %s, %s, %s)
@@ -913,11 +1724,12 @@ def insert_assets_snapshot(base_symbol, contents):
 
 
 def insert_dex_snapshot(base_symbol, contents):
+    connection = cursor = None
     try:
         connection, cursor = get_connection()
         
-        current_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         current_unix_timestamp = int(time.time())
+        current_timestamp = _now_str(current_unix_timestamp)
         insert_query = """
             INSERT INTO dex_infos_snapshots (base_symbol, contents, created_at, updated_at, time_stamp)
             VALUES (%s, %s, %s, %s, %s)
@@ -935,4 +1747,165 @@ def insert_dex_snapshot(base_symbol, contents):
         close_connection(connection, cursor)
 
 
-    
\ No newline at end of file
+    
+
+# Background batch writer for append-only log/snapshot tables
+_QUEUED_TABLES = {
+    'error_loggers': ("(file_name, line, content, created_at, updated_at)", "(%s, %s, %s, %s, %s)"),
+    'error_max_eats': ("""(order_id, exchange, strategy_name, api_key, account_id, base_symbol, exchange_symbol, 
+                price, side, quantity, created_at, updated_at, time_stamp)""", "(" + ", ".join(["%s"] * 13) + ")"),
+    'assets_snap_shot': ("(base_symbol, contents, created_at, updated_at, time_stamp)", "(%s, %s, %s, %s, %s)"),
+    'dex_infos_snapshots': ("(base_symbol, contents, created_at, updated_at, time_stamp)", "(%s, %s, %s, %s, %s)"),
+}
+WRITE_QUEUE_BATCH_SIZE = 500
+WRITE_QUEUE_FLUSH_SEC = 0.5
+_write_queue = queue.Queue()
+_write_thread = None
+_write_thread_lock = threading.Lock()
+# Set at shutdown; _WRITE_STOP wakes the writer thread if it is blocked on get()
+_write_stop = threading.Event()
+_WRITE_STOP = object()
+WRITE_QUEUE_JOIN_TIMEOUT_SEC = 5
+
+def _write_batch(batch):
+    """
+    Writes queued (table, row) pairs with one multi-row INSERT per table and a single commit.
+    """
+    rows_by_table = {}
+    for table, row in batch:
+        rows_by_table.setdefault(table, []).append(row)
+
+    connection = cursor = None
+    try:
+        connection, cursor = get_connection()
+        for table, rows in rows_by_table.items():
+            columns, placeholders = _QUEUED_TABLES[table]
+            _bulk_insert(cursor, table, columns, placeholders, rows)
+        connection.commit()
+    except Exception as err:
+        logger_database.error(f"Error writing {len(batch)} queued rows: {err}")
+    finally:
+        close_connection(connection, cursor)
+
+def _drain_write_queue(first=None):
+    batch = [] if first is None else [first]
+    while len(batch) < WRITE_QUEUE_BATCH_SIZE:
+        try:
+            item = _write_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is not _WRITE_STOP:
+            batch.append(item)
+    if batch:
+        _write_batch(batch)
+    return len(batch)
+
+def _write_loop():
+    while True:
+        first = _write_queue.get()
+        if first is not _WRITE_STOP:
+            # Give producers a moment to fill the batch; returns at once when shutting down
+            _write_stop.wait(WRITE_QUEUE_FLUSH_SEC)
+            _drain_write_queue(first)
+        if _write_stop.is_set():
+            return
+
+def _enqueue_row(table, row):
+    global _write_thread
+    if _write_stop.is_set():
+        # Writer already stopped (interpreter exiting): write straight away
+        _write_batch([(table, row)])
+        return
+    if _write_thread is None or not _write_thread.is_alive():
+        with _write_thread_lock:
+            if _write_thread is None or not _write_thread.is_alive():
+                _write_thread = threading.Thread(target=_write_loop, name="db-write-queue", daemon=True)
+                _write_thread.start()
+    _write_queue.put((table, row))
+
+def flush_write_queue():
+    """
+    Stops the writer thread and writes everything still queued; registered with atexit.
+
+    The thread is woken and joined first so the row it is holding and any batch it
+    is in the middle of writing are committed before the final drain.
+    """
+    _write_stop.set()
+    thread = _write_thread
+    if thread is not None and thread.is_alive():
+        _write_queue.put(_WRITE_STOP)
+        thread.join(WRITE_QUEUE_JOIN_TIMEOUT_SEC)
+    while _drain_write_queue():
+        pass
+
+atexit.register(flush_write_queue)
+
+def queue_error_logger(file_name, line, content):
+    """
+    Queues an error_loggers row for the background batch writer and returns immediately.
+    Identical errors repeated within ERROR_LOG_DEDUP_SEC are written once.
+    """
+    if _is_repeated_error(file_name, line, content):
+        return
+    current_timestamp = _now_str()
+    _enqueue_row('error_loggers', (file_name, line, content, current_timestamp, current_timestamp))
+
+def queue_error_max_eat(order):
+    """
+    Queues an error_max_eats row (same keys as insert_error_max_eat) for the background batch writer.
+    """
+    current_unix_timestamp = int(time.time())
+    current_timestamp = _now_str(current_unix_timestamp)
+    _enqueue_row('error_max_eats', (order['order_id'], order['exchange'], order['strategy_name'], order['api_key'], 
+                                    order['account_id'], order['base_symbol'], order['exchange_symbol'], order['price'], 
+                                    order['side'], order['quantity'], current_timestamp, current_timestamp, current_unix_timestamp))
+
+def queue_assets_snapshot(base_symbol, contents):
+    current_unix_timestamp = int(time.time())
+    current_timestamp = _now_str(current_unix_timestamp)
+    _enqueue_row('assets_snap_shot', (base_symbol, contents, current_timestamp, current_timestamp, current_unix_timestamp))
+
+def queue_dex_snapshot(base_symbol, contents):
+    current_unix_timestamp = int(time.time())
+    current_timestamp = _now_str(current_unix_timestamp)
+    _enqueue_row('dex_infos_snapshots', (base_symbol, contents, current_timestamp, current_timestamp, current_unix_timestamp))
+
+
+async def _run_in_executor(func, *args, **kwargs):
+    """
+    Runs a blocking database helper on the default thread pool so callers can
+    overlap several queries with asyncio.gather. Concurrency is bounded by the
+    connection pool (blocking=True waits for a free connection).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+async def execute_script_location_async(abs_paths_list):
+    return await _run_in_executor(execute_script_location, abs_paths_list)
+
+async def update_strategy_tracking_status_async(key, status):
+    return await _run_in_executor(update_strategy_tracking_status, key, status)
+
+async def insert_make_order_async(order):
+    return await _run_in_executor(insert_make_order, order)
+
+async def fetch_all_make_order_async():
+    return await _run_in_executor(fetch_all_make_order)
+
+async def insert_final_order_async(order):
+    return await _run_in_executor(insert_final_order, order)
+
+async def insert_inventory_value_async(inventory):
+    return await _run_in_executor(insert_inventory_value, inventory)
+
+async def insert_volume_snapshots_async(snapshot):
+    return await _run_in_executor(insert_volume_snapshots, snapshot)
+
+async def calculate_volume_snapshots_async(list_strategy, exchange, base_symbol, quote_symbol, from_time):
+    return await _run_in_executor(calculate_volume_snapshots, list_strategy, exchange, base_symbol, quote_symbol, from_time)
+
+async def fetch_param_by_id_async(param_id):
+    return await _run_in_executor(fetch_param_by_id, param_id)
+
+async def insert_error_logger_async(file_name, line, content):
+    return await _run_in_executor(insert_error_logger, file_name, line, content)
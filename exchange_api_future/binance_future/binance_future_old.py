@@ -1,15 +1,124 @@
 # pylint: disable=too-many-lines,too-many-public-methods
+import asyncio
+import functools
 import time
-import math
 import json
 import hmac
 import hashlib
 import logging
-from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
 from typing import Dict, List, Optional, Any
 
 import requests
 import redis
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# Shared by the async (a*) methods of every client: each REST call is still a
+# blocking requests call, run on its own thread so strategies can gather them.
+_HTTP_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='binance-futures-http')
+
+# (connect, read) timeouts in seconds for REST calls
+_REQUEST_TIMEOUT = (3.05, 27)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize a payload for Redis, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _json_loads(content) -> Any:
+    """Parse a response body or Redis payload, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# REST paths by short name; each client joins them with its base URL once
+_ENDPOINTS = {
+    'ticker': '/fapi/v1/ticker/24hr',
+    'account': '/fapi/v2/account',
+    'order': '/fapi/v1/order',
+    'allOpenOrders': '/fapi/v1/allOpenOrders',
+    'openOrders': '/fapi/v1/openOrders',
+    'allOrders': '/fapi/v1/allOrders',
+    'klines': '/fapi/v1/klines',
+    'userTrades': '/fapi/v1/userTrades',
+    'positionRisk': '/fapi/v2/positionRisk',
+    'leverage': '/fapi/v1/leverage',
+    'marginType': '/fapi/v1/marginType',
+    'positionMargin': '/fapi/v1/positionMargin',
+    'positionMarginHistory': '/fapi/v1/positionMargin/history',
+    'income': '/fapi/v1/income',
+    'balance': '/fapi/v2/balance',
+    'listenKey': '/fapi/v1/listenKey',
+    'fundingRate': '/fapi/v1/fundingRate',
+    'depth': '/fapi/v1/depth',
+    'trades': '/fapi/v1/trades',
+    'historicalTrades': '/fapi/v1/historicalTrades',
+    'aggTrades': '/fapi/v1/aggTrades',
+    'exchangeInfo': '/fapi/v1/exchangeInfo',
+}
+
+# Redis TTLs (milliseconds) for read-only endpoints
+_TICKER_TTL_MS = 1000
+_ORDER_BOOK_TTL_MS = 500
+_CANDLES_TTL_MS = 30000
+_CANDLES_INTRADAY_TTL_MS = 2000
+_FUNDING_RATE_TTL_MS = 60000
+_RECENT_TRADES_TTL_MS = 1000
+_ACCOUNT_TTL_MS = 5000
+_POSITION_TTL_MS = 1000
+# Signed endpoints whose response is the same for every symbol of an API key
+_ACCOUNT_WIDE_ENDPOINTS = frozenset(('account', 'balance'))
+# Scales for every symbol from one exchangeInfo download, shared by all clients
+_SCALE_TABLE_KEY = 'binfut:scales'
+_SCALE_TABLE_TTL = 3600
+_SCALE_TABLE: Dict[str, tuple] = {}
+# How long public market data is kept as a fallback when Binance errors out
+_STALE_TTL_MS = 300000
+
+@functools.lru_cache(maxsize=64)
+def _step_decimals(step: str) -> int:
+    """
+    Number of decimals in a tick/step size string, e.g. "0.0100" -> 2, "1.0" -> 0.
+    
+    Binance only uses a handful of distinct sizes, so the result is memoized.
+    
+    Args:
+        step (str): tickSize or stepSize from exchangeInfo
+    
+    Returns:
+        int: Decimal places
+    """
+    if '.' not in step:
+        return 0
+    return len(step.rstrip('0').partition('.')[2])
+
+def _scales_from_exchange_info(result: Dict[str, Any]) -> Dict[str, tuple]:
+    """
+    Build the symbol -> (price_scale, qty_scale) table from an exchangeInfo response.
+    
+    Args:
+        result (Dict[str, Any]): /fapi/v1/exchangeInfo response
+    
+    Returns:
+        Dict[str, tuple]: Scales keyed by exchange symbol (e.g. "BTCUSDT")
+    """
+    table = {}
+    for symbol_info in result['symbols']:
+        filters = {f['filterType']: f for f in symbol_info['filters']}
+        price_scale = _step_decimals(filters['PRICE_FILTER']['tickSize'])
+        qty_scale = _step_decimals(filters['LOT_SIZE']['stepSize'])
+        table[symbol_info['symbol']] = (price_scale, qty_scale)
+    return table
 
 class BinanceFuturesOldPrivate:
     """
@@ -18,6 +127,14 @@ class BinanceFuturesOldPrivate:
     This class provides methods to interact with Binance's private API endpoints for futures trading.
     """
     
+    # One client per traded symbol: slots keep instances small and attribute access direct
+    __slots__ = (
+        'symbol', 'symbol_ex', 'symbol_redis', '_sym_qs', '_account_key', 'quote',
+        'api_key', 'api_secret', '_api_secret_bytes', 'redis_client', 'redis_expiry',
+        'base_url', '_urls', 'logger', '_http', 'price_scale', 'qty_scale',
+        '_price_fmt', '_qty_fmt',
+    )
+    
     def __init__(self, symbol: str, quote: str = 'USDT', api_key: str = '', 
                  secret_key: str = '', redis_client: Optional[redis.Redis] = None, 
                  redis_expiry: int = 60, testnet: bool = False):
@@ -36,9 +153,12 @@ class BinanceFuturesOldPrivate:
         self.symbol = symbol
         self.symbol_ex = f'{symbol}{quote}'
         self.symbol_redis = f'{symbol}_{quote}'.upper()
+        self._sym_qs = f'symbol={quote_plus(self.symbol_ex)}'
+        self._account_key = 'binfut:' + hashlib.sha1(api_key.encode()).hexdigest()[:16]
         self.quote = quote
         self.api_key = api_key
         self.api_secret = secret_key
+        self._api_secret_bytes = secret_key.encode()
         self.redis_client = redis_client
         self.redis_expiry = redis_expiry
         
@@ -47,117 +167,253 @@ class BinanceFuturesOldPrivate:
             self.base_url = "https://testnet.binancefuture.com"
         else:
             self.base_url = "https://fapi.binance.com"
+        self._urls = {name: f'{self.base_url}{path}' for name, path in _ENDPOINTS.items()}
         
         # Initialize logger
         self.logger = logging.getLogger(__name__)
         
+        # Keep-alive session so follow-on calls skip the TCP/TLS handshake
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504],
+                              raise_on_status=False)
+        )
+        self._http.mount('https://', adapter)
+        if self.api_key:
+            self._http.headers.update({'X-MBX-APIKEY': self.api_key})
+        
         # Initialize price and quantity scales
         self.price_scale, self.qty_scale = self._get_scale()
+        self._price_fmt = f'{{:.{self.price_scale}f}}'
+        self._qty_fmt = f'{{:.{self.qty_scale}f}}'
     
-    def _generate_signature(self, params: Dict[str, Any]) -> str:
+    def _encode_params(self, params: Dict[str, Any]) -> str:
         """
-        Generate signature for API request.
+        URL-encode request parameters, same output as urllib.parse.urlencode.
+        
+        The symbol pair is pre-encoded once per client and numbers need no
+        quoting, so only free-form strings go through quote_plus.
         
         Args:
             params (Dict[str, Any]): Request parameters
         
+        Returns:
+            str: Query string
+        """
+        parts = []
+        for key, value in params.items():
+            if key == 'symbol' and value == self.symbol_ex:
+                parts.append(self._sym_qs)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                parts.append(f'{key}={value}')
+            else:
+                parts.append(f'{quote_plus(key)}={quote_plus(str(value))}')
+        return '&'.join(parts)
+    
+    def _generate_signature(self, query_string: str) -> str:
+        """
+        Generate signature for API request.
+        
+        Args:
+            query_string (str): Encoded query string exactly as it is sent
+        
         Returns:
             str: HMAC SHA256 signature
         """
-        query_string = urlencode(params)
-        return hmac.new(
-            self.api_secret.encode(), 
-            query_string.encode(), 
-            hashlib.sha256
-        ).hexdigest()
+        return hmac.digest(self._api_secret_bytes, query_string.encode(), hashlib.sha256).hex()
     
-    def _send_request(self, method: str, endpoint: str, params: Dict[str, Any] = None, 
+    def _send_request(self, method: str, url: str, params: Dict[str, Any] = None, 
                      signed: bool = False) -> Dict[str, Any]:
         """
         Send request to Binance API.
         
         Args:
-            method (str): HTTP method (GET, POST, DELETE)
-            endpoint (str): API endpoint
+            method (str): HTTP method (GET, POST, PUT, DELETE)
+            url (str): Full endpoint URL, from self._urls
             params (Dict[str, Any], optional): Request parameters. Defaults to None.
             signed (bool, optional): Whether the request needs authentication. Defaults to False.
         
         Returns:
             Dict[str, Any]: API response
         """
-        url = f'{self.base_url}{endpoint}'
-        headers = {'X-MBX-APIKEY': self.api_key} if self.api_key else {}
+        if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        # Initialize params if None
-        if params is None:
-            params = {}
-            
+        # Encode once: the signed string is the one that goes on the wire
+        query_string = self._encode_params(params) if params else ''
         if signed:
-            params['timestamp'] = int(time.time() * 1000)
-            params['signature'] = self._generate_signature(params)
+            timestamp = f'timestamp={int(time.time() * 1000)}'
+            query_string = f'{query_string}&{timestamp}' if query_string else timestamp
+            query_string = f'{query_string}&signature={self._generate_signature(query_string)}'
+        request_url = f'{url}?{query_string}' if query_string else url
             
         try:
-            response = None
-            if method == 'GET':
-                response = requests.get(url, headers=headers, params=params, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, headers=headers, params=params, timeout=30)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, params=params, timeout=30)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-                
-            response.raise_for_status()  # Raise exception for HTTP errors
-            return response.json()
+            response = self._http.request(method, request_url, timeout=_REQUEST_TIMEOUT)
         except requests.exceptions.RequestException as e:
             self.logger.error("API request error: %s", e)
             return {"error": str(e)}
+        
+        # 4xx/5xx (429/418 rate limits included) are returned, not raised
+        if response.status_code >= 400:
+            self.logger.error("HTTP %s from %s: %s", response.status_code, url, response.text[:256])
+            return {"error": response.text, "code": response.status_code}
+        
+        try:
+            return _json_loads(response.content)
+        except ValueError as e:
+            self.logger.error("Invalid JSON from %s: %s", url, e)
+            return {"error": str(e)}
+    
+    def _cached_send(self, cache_key: str, ttl_ms: int, fetch_fn, 
+                     stale_ttl_ms: int = 0) -> Any:
+        """
+        Read-through Redis cache around a REST call.
+        
+        Args:
+            cache_key (str): Redis key for this request
+            ttl_ms (int): Cache lifetime in milliseconds
+            fetch_fn (Callable): Zero-argument function that performs the request
+            stale_ttl_ms (int, optional): If set, keep a longer-lived copy that is
+                served when the request fails. Defaults to 0 (no fallback).
+        
+        Returns:
+            Any: Cached or fresh API response
+        """
+        if not self.redis_client:
+            return fetch_fn()
+        
+        try:
+            cached = self.redis_client.get(cache_key)
+            if cached:
+                return _json_loads(cached)
+        except (redis.RedisError, ValueError) as e:
+            self.logger.warning("Redis cache read failed for %s: %s", cache_key, e)
+        
+        result = fetch_fn()
+        if isinstance(result, dict) and 'error' in result:
+            if stale_ttl_ms:
+                try:
+                    stale = self.redis_client.get(f'{cache_key}:stale')
+                    if stale:
+                        self.logger.warning("Serving stale %s after error: %s", cache_key, result['error'])
+                        return _json_loads(stale)
+                except (redis.RedisError, ValueError) as e:
+                    self.logger.warning("Redis stale read failed for %s: %s", cache_key, e)
+            return result
+        
+        try:
+            payload = _json_dumps(result)
+            pipe = self.redis_client.pipeline()
+            pipe.set(cache_key, payload, px=ttl_ms)
+            if stale_ttl_ms:
+                pipe.set(f'{cache_key}:stale', payload, px=stale_ttl_ms)
+            pipe.execute()
+        except (redis.RedisError, TypeError, ValueError) as e:
+            self.logger.warning("Redis cache write failed for %s: %s", cache_key, e)
+        return result
+    
+    def _public_cache_key(self, endpoint: str, params: Dict[str, Any]) -> str:
+        """
+        Cache key for a public market-data request.
+        
+        Args:
+            endpoint (str): Endpoint name (key of _ENDPOINTS)
+            params (Dict[str, Any]): Request parameters
+        
+        Returns:
+            str: Redis key
+        """
+        digest = hashlib.sha1(self._encode_params(params).encode()).hexdigest()[:16]
+        return f'binfut:{endpoint}:{digest}'
+    
+    def _account_cache_key(self, endpoint: str) -> str:
+        """
+        Cache key for an account-scoped (signed) request of this client.
+        
+        account and balance describe the whole API account, so every client on the
+        same key shares one entry; positionRisk is requested per symbol.
+        
+        Args:
+            endpoint (str): Endpoint name (key of _ENDPOINTS)
+        
+        Returns:
+            str: Redis key
+        """
+        if endpoint in _ACCOUNT_WIDE_ENDPOINTS:
+            return f'{self._account_key}:{endpoint}'
+        return f'{self._account_key}:{endpoint}:{self.symbol_ex}'
+    
+    def _invalidate_account_cache(self) -> None:
+        """
+        Drop cached account, balance and position data after a mutating call.
+        
+        The account-wide entries are shared with the other symbols of this API key,
+        so a fill on any of them refreshes the balance they all read.
+        """
+        if not self.redis_client:
+            return
+        try:
+            self.redis_client.delete(
+                self._account_cache_key('account'),
+                self._account_cache_key('balance'),
+                self._account_cache_key('positionRisk'),
+            )
+        except redis.RedisError as e:
+            self.logger.warning("Failed to invalidate account cache: %s", e)
     
     def _get_scale(self) -> tuple:
         """
         Get price and quantity scales for the symbol.
         
+        The whole exchangeInfo table is downloaded at most once per
+        _SCALE_TABLE_TTL and shared through the process and the Redis hash
+        binfut:scales (field = symbol, value = "price_scale,qty_scale").
+        
         Returns:
             tuple: (price_scale, qty_scale)
         """
+        cached = _SCALE_TABLE.get(self.symbol_ex)
+        if cached is not None:
+            return cached
+        
         # Try to get from Redis cache first
         if self.redis_client:
             try:
-                cache_key = f'{self.symbol_redis}_binance_futures_scale'
-                cached_data = self.redis_client.get(cache_key)
+                cached_data = self.redis_client.hget(_SCALE_TABLE_KEY, self.symbol_ex)
                 if cached_data:
-                    scale = json.loads(cached_data)
-                    return int(scale["priceScale"]), int(scale["qtyScale"])
-            except (redis.RedisError, json.JSONDecodeError, KeyError) as e:
+                    if isinstance(cached_data, bytes):
+                        cached_data = cached_data.decode()
+                    price_scale, qty_scale = cached_data.split(',')
+                    scale = (int(price_scale), int(qty_scale))
+                    _SCALE_TABLE[self.symbol_ex] = scale
+                    return scale
+            except (redis.RedisError, ValueError) as e:
                 self.logger.warning("Redis error or invalid data: %s", e)
         
         # If not in cache or no Redis, fetch from API
         try:
-            endpoint = '/fapi/v1/exchangeInfo'
-            result = self._send_request('GET', endpoint)
+            endpoint = 'exchangeInfo'
+            result = self._send_request('GET', self._urls[endpoint])
+            table = _scales_from_exchange_info(result)
+            _SCALE_TABLE.update(table)
             
-            for symbol_info in result['symbols']:
-                if symbol_info['symbol'] == self.symbol_ex:
-                    price_scale = int(-math.log10(float(symbol_info["filters"][0]["tickSize"])))
-                    qty_scale = int(-math.log10(float(symbol_info["filters"][1]["stepSize"])))
-                    
-                    # Cache in Redis if available
-                    if self.redis_client:
-                        scale_data = {
-                            "priceScale": price_scale,
-                            "qtyScale": qty_scale
-                        }
-                        try:
-                            self.redis_client.setex(
-                                cache_key,
-                                self.redis_expiry,
-                                json.dumps(scale_data)
-                            )
-                        except redis.RedisError as e:
-                            self.logger.warning("Failed to cache scale in Redis: %s", e)
-                    
-                    return price_scale, qty_scale
+            # Cache in Redis if available
+            if self.redis_client and table:
+                try:
+                    pipe = self.redis_client.pipeline()
+                    pipe.hset(_SCALE_TABLE_KEY, mapping={
+                        symbol: f'{price_scale},{qty_scale}'
+                        for symbol, (price_scale, qty_scale) in table.items()
+                    })
+                    pipe.expire(_SCALE_TABLE_KEY, _SCALE_TABLE_TTL)
+                    pipe.execute()
+                except redis.RedisError as e:
+                    self.logger.warning("Failed to cache scale in Redis: %s", e)
             
+            if self.symbol_ex in table:
+                return table[self.symbol_ex]
             raise ValueError("Symbol not found")
         except Exception as e:
             self.logger.error("Error getting scale: %s", e)
@@ -170,9 +426,11 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Ticker information
         """
-        endpoint = '/fapi/v1/ticker/24hr'
+        endpoint = 'ticker'
         params = {'symbol': self.symbol_ex}
-        return self._send_request('GET', endpoint, params)
+        return self._cached_send(self._public_cache_key(endpoint, params), _TICKER_TTL_MS,
+                                 lambda: self._send_request('GET', self._urls[endpoint], params),
+                                 stale_ttl_ms=_STALE_TTL_MS)
     
     def get_account_assets(self) -> List[Dict[str, Any]]:
         """
@@ -181,8 +439,8 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: List of assets
         """
-        endpoint = '/fapi/v2/account'
-        result = self._send_request('GET', endpoint, signed=True)
+        endpoint = 'account'
+        result = self._send_request('GET', self._urls[endpoint], signed=True)
         
         # Check if result contains error or assets
         if isinstance(result, dict):
@@ -228,10 +486,11 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Order placement result
         """
-        endpoint = '/fapi/v1/order'
+        endpoint = 'order'
         
-        # Round quantity and price to respect precision
-        quantity = round(float(quantity), self.qty_scale)
+        # Format quantity and price to the symbol precision; Binance accepts decimal strings
+        price_fmt = self._price_fmt.format
+        quantity = self._qty_fmt.format(float(quantity))
         
         # Prepare parameters
         params = {
@@ -249,7 +508,7 @@ class BinanceFuturesOldPrivate:
         if order_type_upper == 'LIMIT':
             if price is None:
                 raise ValueError("Price must be specified for LIMIT orders")
-            params['price'] = round(float(price), self.price_scale)
+            params['price'] = price_fmt(float(price))
             params['timeInForce'] = tif
         elif order_type_upper == 'MARKET':
             # For MARKET orders, price and timeInForce are not needed
@@ -257,19 +516,19 @@ class BinanceFuturesOldPrivate:
         elif order_type_upper in ['STOP', 'TAKE_PROFIT']:
             if price is None or stop_price is None:
                 raise ValueError("Price and stopPrice must be specified for STOP/TAKE_PROFIT orders")
-            params['price'] = round(float(price), self.price_scale)
-            params['stopPrice'] = round(float(stop_price), self.price_scale)
+            params['price'] = price_fmt(float(price))
+            params['stopPrice'] = price_fmt(float(stop_price))
             params['timeInForce'] = tif
         elif order_type_upper in ['STOP_MARKET', 'TAKE_PROFIT_MARKET']:
             if stop_price is None:
                 raise ValueError("stopPrice must be specified for STOP_MARKET/TAKE_PROFIT_MARKET orders")
-            params['stopPrice'] = round(float(stop_price), self.price_scale)
+            params['stopPrice'] = price_fmt(float(stop_price))
         elif order_type_upper == 'TRAILING_STOP_MARKET':
             if callback_rate is None:
                 raise ValueError("callbackRate must be specified for TRAILING_STOP_MARKET orders")
             params['callbackRate'] = callback_rate
             if activation_price is not None:
-                params['activationPrice'] = round(float(activation_price), self.price_scale)
+                params['activationPrice'] = price_fmt(float(activation_price))
         
         # Add optional parameters
         if reduce_only:
@@ -287,7 +546,9 @@ class BinanceFuturesOldPrivate:
         if client_order_id:
             params['newClientOrderId'] = client_order_id
         
-        return self._send_request('POST', endpoint, params, signed=True)
+        result = self._send_request('POST', self._urls[endpoint], params, signed=True)
+        self._invalidate_account_cache()
+        return result
     
     def cancel_order(self, order_id: int = None, client_order_id: str = None) -> Dict[str, Any]:
         """
@@ -300,7 +561,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Order cancellation result
         """
-        endpoint = '/fapi/v1/order'
+        endpoint = 'order'
         params = {'symbol': self.symbol_ex}
         
         if order_id:
@@ -310,7 +571,9 @@ class BinanceFuturesOldPrivate:
         else:
             raise ValueError("Either order_id or client_order_id must be provided")
         
-        return self._send_request('DELETE', endpoint, params, signed=True)
+        result = self._send_request('DELETE', self._urls[endpoint], params, signed=True)
+        self._invalidate_account_cache()
+        return result
     
     def cancel_all_orders(self) -> Dict[str, Any]:
         """
@@ -319,9 +582,11 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Order cancellation result
         """
-        endpoint = '/fapi/v1/allOpenOrders'
+        endpoint = 'allOpenOrders'
         params = {'symbol': self.symbol_ex}
-        return self._send_request('DELETE', endpoint, params, signed=True)
+        result = self._send_request('DELETE', self._urls[endpoint], params, signed=True)
+        self._invalidate_account_cache()
+        return result
     
     def get_order_details(self, order_id: int = None, client_order_id: str = None) -> Dict[str, Any]:
         """
@@ -334,7 +599,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Order details
         """
-        endpoint = '/fapi/v1/order'
+        endpoint = 'order'
         params = {'symbol': self.symbol_ex}
         
         if order_id:
@@ -344,7 +609,7 @@ class BinanceFuturesOldPrivate:
         else:
             raise ValueError("Either order_id or client_order_id must be provided")
         
-        return self._send_request('GET', endpoint, params, signed=True)
+        return self._send_request('GET', self._urls[endpoint], params, signed=True)
     
     def get_open_orders(self) -> List[Dict[str, Any]]:
         """
@@ -353,9 +618,9 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: List of open orders
         """
-        endpoint = '/fapi/v1/openOrders'
+        endpoint = 'openOrders'
         params = {'symbol': self.symbol_ex}
-        result = self._send_request('GET', endpoint, params, signed=True)
+        result = self._send_request('GET', self._urls[endpoint], params, signed=True)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting open orders: %s", result['error'])
@@ -377,7 +642,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: List of orders
         """
-        endpoint = '/fapi/v1/allOrders'
+        endpoint = 'allOrders'
         params = {
             'symbol': self.symbol_ex,
             'limit': limit
@@ -392,7 +657,7 @@ class BinanceFuturesOldPrivate:
         if order_id:
             params['orderId'] = order_id
         
-        result = self._send_request('GET', endpoint, params, signed=True)
+        result = self._send_request('GET', self._urls[endpoint], params, signed=True)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting all orders: %s", result['error'])
@@ -415,7 +680,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[List[Any]]: List of candles
         """
-        endpoint = '/fapi/v1/klines'
+        endpoint = 'klines'
         params = {
             'symbol': self.symbol_ex, 
             'interval': interval, 
@@ -428,7 +693,10 @@ class BinanceFuturesOldPrivate:
         if end_time:
             params['endTime'] = end_time
         
-        result = self._send_request('GET', endpoint, params)
+        ttl_ms = _CANDLES_INTRADAY_TTL_MS if interval[-1] == 'm' else _CANDLES_TTL_MS
+        result = self._cached_send(self._public_cache_key(endpoint, params), ttl_ms,
+                                   lambda: self._send_request('GET', self._urls[endpoint], params),
+                                   stale_ttl_ms=_STALE_TTL_MS)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting candles: %s", result['error'])
@@ -450,7 +718,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: List of trades
         """
-        endpoint = '/fapi/v1/userTrades'
+        endpoint = 'userTrades'
         params = {
             'symbol': self.symbol_ex,
             'limit': limit
@@ -465,7 +733,7 @@ class BinanceFuturesOldPrivate:
         if from_id:
             params['fromId'] = from_id
         
-        result = self._send_request('GET', endpoint, params, signed=True)
+        result = self._send_request('GET', self._urls[endpoint], params, signed=True)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting trades: %s", result['error'])
@@ -473,16 +741,24 @@ class BinanceFuturesOldPrivate:
         
         return result if isinstance(result, list) else []
     
-    def get_position(self) -> Dict[str, Any]:
+    def get_position(self, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get position information for the symbol.
         
+        Args:
+            use_cache (bool, optional): Serve from the short-lived Redis cache. Pass False
+                when acting on the position. Defaults to True.
+        
         Returns:
             Dict[str, Any]: Position information
         """
-        endpoint = '/fapi/v2/positionRisk'
+        endpoint = 'positionRisk'
         params = {'symbol': self.symbol_ex}
-        result = self._send_request('GET', endpoint, params=params, signed=True)
+        if use_cache:
+            result = self._cached_send(self._account_cache_key(endpoint), _POSITION_TTL_MS,
+                                       lambda: self._send_request('GET', self._urls[endpoint], params=params, signed=True))
+        else:
+            result = self._send_request('GET', self._urls[endpoint], params=params, signed=True)
         
         # Check for errors in the response
         if isinstance(result, dict) and 'error' in result:
@@ -508,8 +784,8 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: List of positions
         """
-        endpoint = '/fapi/v2/positionRisk'
-        result = self._send_request('GET', endpoint, signed=True)
+        endpoint = 'positionRisk'
+        result = self._send_request('GET', self._urls[endpoint], signed=True)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting all positions: %s", result['error'])
@@ -527,12 +803,14 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Leverage change result
         """
-        endpoint = '/fapi/v1/leverage'
+        endpoint = 'leverage'
         params = {
             'symbol': self.symbol_ex,
             'leverage': leverage
         }
-        return self._send_request('POST', endpoint, params, signed=True)
+        result = self._send_request('POST', self._urls[endpoint], params, signed=True)
+        self._invalidate_account_cache()
+        return result
     
     def change_margin_type(self, margin_type: str) -> Dict[str, Any]:
         """
@@ -544,12 +822,14 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Margin type change result
         """
-        endpoint = '/fapi/v1/marginType'
+        endpoint = 'marginType'
         params = {
             'symbol': self.symbol_ex,
             'marginType': margin_type
         }
-        return self._send_request('POST', endpoint, params, signed=True)
+        result = self._send_request('POST', self._urls[endpoint], params, signed=True)
+        self._invalidate_account_cache()
+        return result
     
     def change_position_margin(self, amount: float, type_num: int) -> Dict[str, Any]:
         """
@@ -562,13 +842,15 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Position margin change result
         """
-        endpoint = '/fapi/v1/positionMargin'
+        endpoint = 'positionMargin'
         params = {
             'symbol': self.symbol_ex,
             'amount': amount,
             'type': type_num
         }
-        return self._send_request('POST', endpoint, params, signed=True)
+        result = self._send_request('POST', self._urls[endpoint], params, signed=True)
+        self._invalidate_account_cache()
+        return result
     
     def get_position_margin_history(self, type_num: int = None, 
                                    start_time: int = None, end_time: int = None, 
@@ -585,7 +867,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: Position margin history
         """
-        endpoint = '/fapi/v1/positionMargin/history'
+        endpoint = 'positionMarginHistory'
         params = {
             'symbol': self.symbol_ex,
             'limit': limit
@@ -600,7 +882,7 @@ class BinanceFuturesOldPrivate:
         if end_time:
             params['endTime'] = end_time
         
-        result = self._send_request('GET', endpoint, params, signed=True)
+        result = self._send_request('GET', self._urls[endpoint], params, signed=True)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting position margin history: %s", result['error'])
@@ -624,7 +906,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: Income history
         """
-        endpoint = '/fapi/v1/income'
+        endpoint = 'income'
         params = {
             'limit': limit
         }
@@ -641,7 +923,7 @@ class BinanceFuturesOldPrivate:
         if end_time:
             params['endTime'] = end_time
         
-        result = self._send_request('GET', endpoint, params, signed=True)
+        result = self._send_request('GET', self._urls[endpoint], params, signed=True)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting income history: %s", result['error'])
@@ -656,8 +938,9 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Account information
         """
-        endpoint = '/fapi/v2/account'
-        return self._send_request('GET', endpoint, signed=True)
+        endpoint = 'account'
+        return self._cached_send(self._account_cache_key(endpoint), _ACCOUNT_TTL_MS,
+                                 lambda: self._send_request('GET', self._urls[endpoint], signed=True))
     
     def get_balance(self) -> List[Dict[str, Any]]:
         """
@@ -666,8 +949,9 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: Account balance
         """
-        endpoint = '/fapi/v2/balance'
-        result = self._send_request('GET', endpoint, signed=True)
+        endpoint = 'balance'
+        result = self._cached_send(self._account_cache_key(endpoint), _ACCOUNT_TTL_MS,
+                                   lambda: self._send_request('GET', self._urls[endpoint], signed=True))
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting balance: %s", result['error'])
@@ -682,8 +966,8 @@ class BinanceFuturesOldPrivate:
         Returns:
             str: Listen key
         """
-        endpoint = '/fapi/v1/listenKey'
-        result = self._send_request('POST', endpoint, signed=True)
+        endpoint = 'listenKey'
+        result = self._send_request('POST', self._urls[endpoint], signed=True)
         
         if isinstance(result, dict) and 'listenKey' in result:
             return result['listenKey']
@@ -701,9 +985,9 @@ class BinanceFuturesOldPrivate:
         Returns:
             bool: Success status
         """
-        endpoint = '/fapi/v1/listenKey'
+        endpoint = 'listenKey'
         params = {'listenKey': listen_key}
-        result = self._send_request('PUT', endpoint, params, signed=True)
+        result = self._send_request('PUT', self._urls[endpoint], params, signed=True)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error keeping listen key alive: %s", result['error'])
@@ -721,9 +1005,9 @@ class BinanceFuturesOldPrivate:
         Returns:
             bool: Success status
         """
-        endpoint = '/fapi/v1/listenKey'
+        endpoint = 'listenKey'
         params = {'listenKey': listen_key}
-        result = self._send_request('DELETE', endpoint, params, signed=True)
+        result = self._send_request('DELETE', self._urls[endpoint], params, signed=True)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error closing listen key: %s", result['error'])
@@ -744,7 +1028,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: Funding rate history
         """
-        endpoint = '/fapi/v1/fundingRate'
+        endpoint = 'fundingRate'
         params = {
             'symbol': self.symbol_ex,
             'limit': limit
@@ -756,7 +1040,9 @@ class BinanceFuturesOldPrivate:
         if end_time:
             params['endTime'] = end_time
         
-        result = self._send_request('GET', endpoint, params)
+        result = self._cached_send(self._public_cache_key(endpoint, params), _FUNDING_RATE_TTL_MS,
+                                   lambda: self._send_request('GET', self._urls[endpoint], params),
+                                   stale_ttl_ms=_STALE_TTL_MS)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting funding rate: %s", result['error'])
@@ -775,12 +1061,15 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Order book
         """
-        endpoint = '/fapi/v1/depth'
+        endpoint = 'depth'
         params = {
             'symbol': self.symbol_ex,
             'limit': limit
         }
-        return self._send_request('GET', endpoint, params)
+        if limit > 100:
+            return self._send_request('GET', self._urls[endpoint], params)
+        return self._cached_send(self._public_cache_key(endpoint, params), _ORDER_BOOK_TTL_MS,
+                                 lambda: self._send_request('GET', self._urls[endpoint], params))
     
     def get_recent_trades(self, limit: int = 500) -> List[Dict[str, Any]]:
         """
@@ -792,12 +1081,13 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: Recent trades
         """
-        endpoint = '/fapi/v1/trades'
+        endpoint = 'trades'
         params = {
             'symbol': self.symbol_ex,
             'limit': limit
         }
-        result = self._send_request('GET', endpoint, params)
+        result = self._cached_send(self._public_cache_key(endpoint, params), _RECENT_TRADES_TTL_MS,
+                                   lambda: self._send_request('GET', self._urls[endpoint], params))
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting recent trades: %s", result['error'])
@@ -816,7 +1106,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: Historical trades
         """
-        endpoint = '/fapi/v1/historicalTrades'
+        endpoint = 'historicalTrades'
         params = {
             'symbol': self.symbol_ex,
             'limit': limit
@@ -825,7 +1115,7 @@ class BinanceFuturesOldPrivate:
         if from_id:
             params['fromId'] = from_id
         
-        result = self._send_request('GET', endpoint, params)
+        result = self._send_request('GET', self._urls[endpoint], params)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting historical trades: %s", result['error'])
@@ -847,7 +1137,7 @@ class BinanceFuturesOldPrivate:
         Returns:
             List[Dict[str, Any]]: Aggregate trades
         """
-        endpoint = '/fapi/v1/aggTrades'
+        endpoint = 'aggTrades'
         params = {
             'symbol': self.symbol_ex,
             'limit': limit
@@ -862,7 +1152,7 @@ class BinanceFuturesOldPrivate:
         if from_id:
             params['fromId'] = from_id
         
-        result = self._send_request('GET', endpoint, params)
+        result = self._send_request('GET', self._urls[endpoint], params)
         
         if isinstance(result, dict) and 'error' in result:
             self.logger.error("Error getting aggregate trades: %s", result['error'])
@@ -877,7 +1167,8 @@ class BinanceFuturesOldPrivate:
         Returns:
             Dict[str, Any]: Order placement result
         """
-        position = self.get_position()
+        # Size the order from the live position, not a cached one
+        position = self.get_position(use_cache=False)
         
         # Check for errors in position response
         if 'error' in position:
@@ -886,11 +1177,58 @@ class BinanceFuturesOldPrivate:
         # Check if there's an active position
         if position and 'positionAmt' in position and float(position['positionAmt']) != 0:
             side = 'SELL' if float(position['positionAmt']) > 0 else 'BUY'
+            # place_order formats the quantity to the symbol precision
             quantity = abs(float(position['positionAmt']))
             
-            # Round quantity to respect the quantity scale
-            quantity = round(quantity, self.qty_scale)
-            
-            return self.place_order(order_side=side, quantity=quantity, order_type='MARKET')
+            # reduce_only: never flips into an opposite position if the size moved meanwhile
+            return self.place_order(order_side=side, quantity=quantity, order_type='MARKET', reduce_only=True)
             
-        return {"message": "No open position to close."}
\ No newline at end of file
+        return {"message": "No open position to close."}
+
+    async def _run_async(self, func, *args, **kwargs):
+        """
+        Run a blocking REST method on the shared HTTP executor.
+        
+        Args:
+            func (Callable): Bound method of this client
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Any: Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_HTTP_EXECUTOR, functools.partial(func, *args, **kwargs))
+    
+    async def aget_ticker(self) -> Dict[str, Any]:
+        """Async variant of get_ticker."""
+        return await self._run_async(self.get_ticker)
+    
+    async def aget_open_orders(self) -> List[Dict[str, Any]]:
+        """Async variant of get_open_orders."""
+        return await self._run_async(self.get_open_orders)
+    
+    async def aget_position(self) -> Dict[str, Any]:
+        """Async variant of get_position."""
+        return await self._run_async(self.get_position)
+    
+    async def aget_balance(self) -> List[Dict[str, Any]]:
+        """Async variant of get_balance."""
+        return await self._run_async(self.get_balance)
+    
+    async def aget_candles(self, interval: str = '1h', limit: int = 200, 
+                           start_time: int = None, end_time: int = None) -> List[List[Any]]:
+        """Async variant of get_candles."""
+        return await self._run_async(self.get_candles, interval, limit, start_time, end_time)
+    
+    async def aget_order_book(self, limit: int = 100) -> Dict[str, Any]:
+        """Async variant of get_order_book."""
+        return await self._run_async(self.get_order_book, limit)
+    
+    async def aplace_order(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of place_order; takes the same arguments."""
+        return await self._run_async(self.place_order, *args, **kwargs)
+    
+    async def acancel_order(self, order_id: int = None, client_order_id: str = None) -> Dict[str, Any]:
+        """Async variant of cancel_order."""
+        return await self._run_async(self.cancel_order, order_id, client_order_id)
@@ -7,11 +7,34 @@ import hashlib
 import hmac
 from datetime import datetime
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 _default_url = 'https://api.poloniex.com'
 
 
+def _build_http_session():
+    """
+    Build a shared HTTP session so Poloniex calls reuse keep-alive TLS connections.
+
+    Returns:
+        requests.Session: Session with a pooled adapter mounted for https.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+# Shared by every Request instance; auth headers are per call, so one pool serves all keys.
+_SESSION = _build_http_session()
+
+
 class RequestError(Exception):
     """
     Exception class used to report errors from trade engine.
@@ -88,7 +111,7 @@ class Request:
                 raise RequestError(-1, "Authenticated endpoints required api_secret and api_key to be set.")
 
         url = urljoin(self._url, path)
-        response = requests.request(method,
+        response = _SESSION.request(method,
                                     url,
                                     headers=headers,
                                     timeout=self._timeout_sec,
@@ -1,23 +1,86 @@
+import asyncio
+import functools
+import hashlib
 import requests
+import threading
 import time, json
 from utils import calculate_gap_hours,get_candle_data_info, convert_order_status, make_golang_api_call
 import redis
 # from logger import logger_poloniex
 from .authentication import Request
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 import uuid
 from logger import logger_access, logger_error, logger_database
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 base_url = "https://api.poloniex.com"
-r = redis.Redis(host='localhost', port=6379, decode_responses=True)
+# Pool dùng chung cho mọi PoloniexPrivate trong process; khi hết connection thì
+# chờ tối đa 1s thay vì mở thêm socket mới.
+_REDIS_POOL = redis.BlockingConnectionPool(host='localhost', port=6379, decode_responses=True,
+                                           max_connections=32, timeout=1)
+r = redis.Redis(connection_pool=_REDIS_POOL)
 
 # Golang API configuration
 GOLANG_API_BASE_URL = "http://localhost:8083"
 
+# symbol_redis -> (price_scale, qty_scale); scale của một cặp gần như không đổi
+# nên chỉ cần đọc Redis / gọi /markets một lần cho mỗi process.
+_SCALE_CACHE = {}
+_SCALE_LOCK = threading.Lock()
+
+# /accounts/balances được cache ngắn hạn trong Redis để các hàm balance gọi
+# liên tiếp trong một tick dùng chung một request.
+BALANCE_CACHE_TTL = 2
+# Giá /markets/{symbol}/price dùng chung giữa các worker trong cửa sổ ngắn (ms).
+PRICE_CACHE_TTL_MS = 500
+# Index currency -> asset giữ trên instance cho get_account_assets (giây).
+ASSET_INDEX_TTL = 0.5
+
+# Executor cho các hàm a* (async): mỗi request HTTP vẫn là blocking nên chạy
+# trên thread riêng để strategy có thể asyncio.gather nhiều symbol cùng lúc.
+_HTTP_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='poloniex-http')
+
+def _json_dumps(data):
+    """Serialize a Redis payload to str, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+def _json_loads(content):
+    """Parse a Redis payload, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+_INTERVAL_MAP = {
+    "1m": "MINUTE_1",
+    "5m": "MINUTE_5",
+    "15m": "MINUTE_15",
+    "30m": "MINUTE_30",
+    "1h": "HOUR_1",
+    "4h": "HOUR_4",
+    "6h": "HOUR_6",
+    "12h": "HOUR_12",
+    "1d": "DAY_1",
+    "3d": "DAY_3",
+    "1w": "WEEK_1",
+    "1M": "MONTH_1",
+}
+
 class PoloniexPrivate:
     def __init__(self,  symbol, quote = 'USDT', api_key = '', secret_key='', passphrase='', session_key=''):
         self._symbol = None
         self._quote = None
+        self.qty_scale = 0
+        self.price_scale = 0
+        self._request = Request(api_key, secret_key, url=base_url)
         self.symbol = symbol
         self.quote = quote
         self.base = symbol
@@ -27,9 +90,8 @@ class PoloniexPrivate:
         self.secret_key = secret_key
         self.base_url = base_url.rstrip("/")
         self.r = r
-        self._request = Request(api_key, secret_key, url=base_url)
-        self.qty_scale = 0
-        self.price_scale = 0
+        self._balance_key = 'poloniex:balances:' + hashlib.sha1(api_key.encode()).hexdigest()[:16]
+        self._asset_index = {}
         self.session_key = session_key or str(uuid.uuid4())  # Generate unique session key if not provided
         
         
@@ -45,6 +107,28 @@ class PoloniexPrivate:
         self._symbol = value
         self.update_symbol_data()
 
+    @property
+    def price_scale(self):
+        """Getter method for the price_scale property."""
+        return self._price_scale
+
+    @price_scale.setter
+    def price_scale(self, value):
+        """Setter method for the price_scale property; caches the amount format template."""
+        self._price_scale = value
+        self._price_fmt = f'{{:.{value}f}}'
+
+    @property
+    def qty_scale(self):
+        """Getter method for the qty_scale property."""
+        return self._qty_scale
+
+    @qty_scale.setter
+    def qty_scale(self, value):
+        """Setter method for the qty_scale property; caches the quantity format template."""
+        self._qty_scale = value
+        self._qty_fmt = f'{{:.{value}f}}'
+
     @property
     def quote(self):
         """Getter method for the quote property."""
@@ -62,40 +146,33 @@ class PoloniexPrivate:
             self.symbol_ex = f"{self._symbol}{self._quote}"
             self.symbol_redis = f"{self._symbol}_{self._quote}".upper()
 
+            cached = _SCALE_CACHE.get(self.symbol_redis)
+            if cached is not None:
+                self.price_scale, self.qty_scale = cached
+                return
+
             # Redis check
             scale_redis = r.get(f'{self.symbol_redis}_poloniex_scale')
             if scale_redis is not None:
-                scale = json.loads(scale_redis)
+                scale = _json_loads(scale_redis)
                 self.price_scale, self.qty_scale = int(scale["priceScale"]), int(scale["qtyScale"])
             else:
-                self.price_scale, self.qty_scale = self.get_scale()
-                scale = json.dumps({'priceScale': self.price_scale, 'qtyScale': self.qty_scale})
+                self.price_scale, self.qty_scale = self.get_scale(self._symbol, self._quote)
+                scale = _json_dumps({'priceScale': self.price_scale, 'qtyScale': self.qty_scale})
                 r.set(f'{self.symbol_redis}_poloniex_scale', scale)
 
+            with _SCALE_LOCK:
+                _SCALE_CACHE[self.symbol_redis] = (self.price_scale, self.qty_scale)
+
 
 
     def get_candles(self, base = "", quote="", interval='1h', limit=200, start_time=0):
-        candles_list = {
-            "1m": "MINUTE_1",
-            "5m": "MINUTE_5",
-            "15m": "MINUTE_15",
-            "30m": "MINUTE_30",
-            "1h": "HOUR_1",
-            "4h": "HOUR_4",
-            "6h": "HOUR_6",
-            "12h": "HOUR_12",
-            "1d": "DAY_1",
-            "3d": "DAY_3",
-            "1w": "WEEK_1",
-            "1M": "MONTH_1", 
-        }
-         
         symbol = f'{base}_{quote}'
         if base == "":
             symbol = self.symbol_ex
         params_map = {
             "symbol": symbol,
-            "interval": candles_list.get(interval, "1h"),
+            "interval": _INTERVAL_MAP.get(interval, "HOUR_1"),
             "limit": limit,
         }
         if start_time:
@@ -103,18 +180,10 @@ class PoloniexPrivate:
             
         result = self._request('GET', f'/markets/{symbol}/candles', params=params_map)
         if isinstance(result, list):
-            candles = []
-            for item in result:
-                candles.append([
-                    item[12],  # open time
-                    float(item[2]),  # open price
-                    float(item[1]),  # high price
-                    float(item[0]),  # low price
-                    float(item[3]),  # close price
-                    float(item[5]),  # base volume
-                    item[12],  # open time (again)
-                    float(item[4])   # quote volume
-                ])
+            # [open time, open, high, low, close, base volume, open time, quote volume]
+            candles = [[item[12], float(item[2]), float(item[1]), float(item[0]),
+                        float(item[3]), float(item[5]), item[12], float(item[4])]
+                       for item in result]
             return {"ts": int(time.time() * 1000), "candle": candles}
         return result
     
@@ -126,20 +195,24 @@ class PoloniexPrivate:
             
         result = self._request('GET', f'/markets/{symbol}/ticker24h')
         if isinstance(result, dict):
-            ticker_data = result
+            now_ms = int(time.time() * 1000)
+            close = result.get("close", "0")
+            quantity = result.get("quantity", "0")
+            high = result.get("high", "0")
+            low = result.get("low", "0")
             formatted_ticker = {
-                "ts": ticker_data.get("ts", int(time.time() * 1000)),
-                "ts-sv": int(time.time() * 1000),
-                "last": ticker_data.get("close", "0"),
-                "lastPr": ticker_data.get("close", "0"),
-                "baseVolume": ticker_data.get("quantity", "0"),
-                "quoteVolume": ticker_data.get("amount", "0"),
-                "bidPr": ticker_data.get("high", "0"),  # Note: This should probably be actual bid price
-                "bestBid": ticker_data.get("high", "0"),  # Note: This should probably be actual bid price
-                "askPr": ticker_data.get("low", "0"),  # Note: This should probably be actual ask price
-                "bestAsk": ticker_data.get("low", "0"),  # Note: This should probably be actual ask price
-                "bidSz": ticker_data.get("quantity", "0"),
-                "askSz": ticker_data.get("quantity", "0")
+                "ts": result.get("ts", now_ms),
+                "ts-sv": now_ms,
+                "last": close,
+                "lastPr": close,
+                "baseVolume": quantity,
+                "quoteVolume": result.get("amount", "0"),
+                "bidPr": high,  # Note: This should probably be actual bid price
+                "bestBid": high,  # Note: This should probably be actual bid price
+                "askPr": low,  # Note: This should probably be actual ask price
+                "bestAsk": low,  # Note: This should probably be actual ask price
+                "bidSz": quantity,
+                "askSz": quantity
             }
             return formatted_ticker
         return {}
@@ -159,16 +232,53 @@ class PoloniexPrivate:
 
         return price_scale, qty_scale
     
-    def get_account_balance(self, account_type=None): 
+    def _get_balances(self, account_type=None):
+        """
+        Fetch /accounts/balances, read-through a short-lived Redis cache.
+
+        Args:
+            account_type (str, optional): Poloniex accountType filter.
+
+        Returns:
+            The raw API response (list of accounts on success).
+        """
+        field = account_type or 'all'
+        try:
+            cached = self.r.hget(self._balance_key, field)
+            if cached is not None:
+                return _json_loads(cached)
+        except Exception:
+            pass
+
         params = {}
         if account_type is not None:
             params.update({'accountType': account_type})
-
         result = self._request('GET', '/accounts/balances', True, params=params)
+
+        if isinstance(result, list):
+            try:
+                pipe = self.r.pipeline()
+                pipe.hset(self._balance_key, field, _json_dumps(result))
+                pipe.expire(self._balance_key, BALANCE_CACHE_TTL)
+                pipe.execute()
+            except Exception:
+                pass
+        return result
+
+    def _invalidate_balances(self):
+        """Drop cached balances after an order is placed or cancelled."""
+        self._asset_index.clear()
+        try:
+            self.r.delete(self._balance_key)
+        except Exception:
+            pass
+
+    def get_account_balance(self, account_type=None): 
+        result = self._get_balances(account_type)
         if isinstance(result, list):
+            account_balance = {}
             for account in result:
                 if "balances" in account:  
-                    account_balance = {}
                     for asset in account["balances"]:
                         data = {
                             "asset": asset["currency"],
@@ -181,57 +291,83 @@ class PoloniexPrivate:
             return {'data': account_balance}
         return {'data':{}}
     
-    def get_account_assets(self, coin, account_type=None): 
-        params = {}
-        if account_type is not None:
-            params.update({'accountType': account_type})
-
-        result = self._request('GET', '/accounts/balances', True, params=params)
-        # logger_poloniex.warning(f'result {result}')
-
+    def _get_asset_index(self, account_type=None):
+        """
+        Map currency -> raw balance entry, built once per ASSET_INDEX_TTL.
 
+        When several accounts hold the same currency the first one wins, matching
+        the order the API returns them in.
+        """
+        field = account_type or 'all'
+        now = time.monotonic()
+        cached = self._asset_index.get(field)
+        if cached is not None and now - cached[0] < ASSET_INDEX_TTL:
+            return cached[1]
+
+        by_ccy = {}
+        result = self._get_balances(account_type)
         if isinstance(result, list):
             for account in result:
-                if "balances" in account:  
-                    for asset in account["balances"]: 
-                        if asset["currency"] == coin: 
-                            data = {
-                                "asset": asset["currency"],
-                                "available": float(asset["available"]),
-                                "locked": float(asset["hold"]),
-                                "total": float(asset["available"]) + float(asset["hold"])
-                            }
-                            return {'data': data}
+                for asset in account.get("balances", ()):
+                    by_ccy.setdefault(asset["currency"], asset)
+            self._asset_index[field] = (now, by_ccy)
+        return by_ccy
+
+    def get_account_assets(self, coin, account_type=None): 
+        asset = self._get_asset_index(account_type).get(coin)
+        if asset is not None:
+            available, locked = float(asset["available"]), float(asset["hold"])
+            data = {
+                "asset": asset["currency"],
+                "available": available,
+                "locked": locked,
+                "total": available + locked
+            }
+            return {'data': data}
         return {'data':{}}
     
     def get_user_asset(self, account_type = None):
         base_inventory, quote_inventory, quote_usdt_inventory = 0, 0, 0
-        params = {}
-        if account_type is not None:
-            params.update({'accountType': account_type})
-
-        result = self._request('GET', '/accounts/balances', True, params=params)
+        result = self._get_balances(account_type)
         if isinstance(result, list):
+            quote, base = self.quote, self.base
+            targets = {quote, "USDT", base}
             for account in result:
-                if "balances" in account: 
-                    for asset in account["balances"]:
-                        if float(asset["available"]) > 0 or float(asset["hold"]) > 0:
-                            available = asset['available']
-                            currency = asset['currency']
-                            locked = float(asset['hold'])
-                            if currency == self.quote:
-                                quote_inventory += float(available) + float(locked)
-                            if currency == "USDT":
-                                quote_usdt_inventory += float(available) + float(locked)
-                            if currency == self.base:
-                                base_inventory += float(available) + float(locked)
+                for asset in account.get("balances", ()):
+                    currency = asset['currency']
+                    if currency not in targets:
+                        continue
+                    total = float(asset['available']) + float(asset['hold'])
+                    if total <= 0:
+                        continue
+                    # quote có thể chính là USDT nên cộng riêng từng bucket
+                    if currency == quote:
+                        quote_inventory += total
+                    if currency == "USDT":
+                        quote_usdt_inventory += total
+                    if currency == base:
+                        base_inventory += total
         return base_inventory, quote_inventory, quote_usdt_inventory
 
     def get_price(self, base = '', quote =''):
         symbol = f'{self.base}_{self.quote}'
         if self.base == "":
             symbol = self.symbol_ex
-        return self._request('GET', f'/markets/{symbol}/price')
+        key = f'poloniex:price:{symbol}'
+        try:
+            cached = self.r.get(key)
+            if cached is not None:
+                return _json_loads(cached)
+        except Exception:
+            pass
+
+        result = self._request('GET', f'/markets/{symbol}/price')
+        if isinstance(result, dict) and 'price' in result:
+            try:
+                self.r.set(key, _json_dumps(result), px=PRICE_CACHE_TTL_MS)
+            except Exception:
+                pass
+        return result
     
 
     
@@ -328,18 +464,16 @@ class PoloniexPrivate:
         symbol = f'{self.base}_{self.quote}'
         if self.base == "":
             symbol = self.symbol_ex        
-        current_price = self.get_price()
-        if not current_price or 'price' not in current_price:
-            raise ValueError("Failed to get current price")
-        price_scale = self.price_scale
-        quantity_scale = self.qty_scale
+        side = side_order.upper()
+        order_type = order_type.upper()
+        quantity_str = self._qty_fmt.format(float(quantity))
         logger_access.info("log 1")
-        logger_access.info(f"quantity: {format(float(quantity), f'.{quantity_scale}f')}")
+        logger_access.info(f"quantity: {quantity_str}")
         params_map = {
             "symbol": symbol,
-            "side": side_order.upper(),
-            "type": order_type.upper(),
-            "quantity": format(float(quantity), f'.{quantity_scale}f'),
+            "side": side,
+            "type": order_type,
+            "quantity": quantity_str,
             "timeInForce": force
         }
         if price:
@@ -347,26 +481,26 @@ class PoloniexPrivate:
         
         logger_access.info("log 2")
 
-        if order_type.upper() == 'MARKET' and 'price' in params_map:
+        if order_type == 'MARKET' and 'price' in params_map:
             del params_map['price']
         
         
-        if order_type.upper() == 'MARKET' and side_order.upper() == 'BUY':
-            amount_value = float(current_price.get("price"))* quantity
+        if order_type == 'MARKET' and side == 'BUY':
+            # Chỉ market buy cần giá hiện tại để quy quantity ra amount (quote).
+            current_price = self.get_price()
+            if not current_price or 'price' not in current_price:
+                raise ValueError("Failed to get current price")
+            amount_value = float(current_price.get("price")) * float(quantity)
             del params_map['quantity']
-            params_map["amount"] = format(amount_value, f'.{price_scale}f')
+            params_map["amount"] = self._price_fmt.format(amount_value)
             
-        body = {}
-        body.update(params_map)
-
         logger_access.info("log 3")
-        logger_access.info(f'Placing order with body: {body}')
+        logger_access.info('Placing order with body: %s', params_map)
 
-        result = self._request('POST', '/orders', True, body=body)
-        logger_access.info('result test: ',result)
+        result = self._request('POST', '/orders', True, body=params_map)
+        self._invalidate_balances()
         
         if result and isinstance(result, dict) and "id" in result:
-            logger_access.info('run 1')
             result['orderId'] = result['id']
             
             # ✅ NEW: Store order in Golang API
@@ -375,13 +509,13 @@ class PoloniexPrivate:
                 # Prepare order data for Golang API
                 order_data_for_golang = {
                     "symbol": symbol,
-                    "side": side_order.upper(),
-                    "type": order_type.upper(),
+                    "side": side,
+                    "type": order_type,
                     "quantity": params_map.get("quantity", params_map.get("amount", quantity)),
                     "price": params_map.get("price", 0),
                     "timeInForce": force
                 }
-                logger_access.info('result: ', result)
+                logger_access.info('result: %s', result)
                 # Store order in Golang API
                 self.store_order_in_golang_api(
                     order_data_for_golang,
@@ -426,7 +560,9 @@ class PoloniexPrivate:
         else:
             return self.cancel_orders()
 
-        return self._request('DELETE', path, True)
+        result = self._request('DELETE', path, True)
+        self._invalidate_balances()
+        return result
     
     def cancel_orders(self, symbol=None, account_type=None):
         symbol = f'{self.base}_{self.quote}'
@@ -443,7 +579,9 @@ class PoloniexPrivate:
         if account_type is not None:
             body.update({'accountType': account_type})
 
-        return self._request('DELETE', '/orders', True, body=body)
+        result = self._request('DELETE', '/orders', True, body=body)
+        self._invalidate_balances()
+        return result
     
 
     def get_order_details(self, order_id=None, client_order_id=None): 
@@ -481,19 +619,27 @@ class PoloniexPrivate:
         params = {}
        
         result = self._request('GET', '/orders', True, params=params)
-        for item in result:
-            item.update({"fillQuantity": item["filledQuantity"], 
-                        "quantity": item["quantity"],
-                        "fillPrice": item["price"],
-                        "status": convert_order_status(item["state"]),
-                        # "fee": item["sumFeeAmount"],
-                        "orderType": item["type"],
-                        "createTime": item["createTime"],
-                        "updateTime": item["updateTime"],
-                        "orderId": item["id"] 
-                        })
-
-        return {"data": result}
+        _cvt = convert_order_status
+        # Giữ nguyên các field gốc của Poloniex; các field đã chuẩn hoá ghi đè lên khi trùng tên.
+        orders = [{
+            **item,
+            "orderId": item["id"],
+            "id": item["id"],
+            "clientOrderId": item.get("clientOrderId", ""),
+            "symbol": item["symbol"],
+            "side": item["side"],
+            "price": item["price"],
+            "quantity": item["quantity"],
+            "fillQuantity": item["filledQuantity"],
+            "fillPrice": item["price"],
+            "status": _cvt(item["state"]),
+            # "fee": item["sumFeeAmount"],
+            "orderType": item["type"],
+            "createTime": item["createTime"],
+            "updateTime": item["updateTime"],
+        } for item in result]
+
+        return {"data": orders}
 
 
     def snap_shot_account(self, coin_list = None):
@@ -513,19 +659,13 @@ class PoloniexPrivate:
             }
             spot_assets_list =  self.get_account_balance('spot')
             for keys, value in spot_assets_list['data'].items():
-                balances_spot_keys = f'{keys}'
                 total = value['total']
-                balances_spot[balances_spot_keys] = total
-                if balances_spot_keys not in balance_asset_temp:
-                    balance_asset_temp[balances_spot_keys] = 0
-                balance_asset_temp[balances_spot_keys] += total
+                balances_spot[keys] = total
+                balance_asset_temp[keys] = balance_asset_temp.get(keys, 0) + total
             total_balance.append(balances_spot)
             #TELEGRAM
             for asset_snap_shot in coin_list:
-                if asset_snap_shot not in balance_asset_temp:
-                    telegram_snap_shot[asset_snap_shot] = 0
-                else:
-                    telegram_snap_shot[asset_snap_shot] = balance_asset_temp[asset_snap_shot]
+                telegram_snap_shot[asset_snap_shot] = balance_asset_temp.get(asset_snap_shot, 0)
             total_balance.append(telegram_snap_shot)
             return total_balance
     
@@ -533,9 +673,62 @@ class PoloniexPrivate:
         redis_klines = get_candle_data_info(symbol_redis=f"{symbol_input}_{quote_input}", exchange_name="poloniex", interval=interval, r=r)
         tick_number = calculate_gap_hours(start_time, int(time.time() * 1000))
         if redis_klines is not None:
-            return {'data': redis_klines['candle'][-tick_number:]}
+            have = redis_klines['candle']
+            # Cache đủ số nến thì cắt từ cache; thiếu thì gọi REST thay vì trả về ít hơn yêu cầu.
+            if len(have) >= tick_number:
+                if tick_number <= 0 or len(have) == tick_number:
+                    return {'data': have}
+                return {'data': have[-tick_number:]}
         klines = self.get_candles(base = symbol_input, 
                                     quote =quote_input, 
                                     interval = interval, 
                                     start_time = start_time)
-        return {'data':klines['candle']}
\ No newline at end of file
+        return {'data':klines['candle']}
+
+    async def _run_async(self, func, *args, **kwargs):
+        """
+        Runs a blocking REST helper on the shared HTTP executor so callers can
+        overlap requests for several symbols with asyncio.gather.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_HTTP_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+    async def aget_candles(self, base="", quote="", interval='1h', limit=200, start_time=0):
+        return await self._run_async(self.get_candles, base, quote, interval, limit, start_time)
+
+    async def aget_ticker(self, base="", quote=""):
+        return await self._run_async(self.get_ticker, base, quote)
+
+    async def aget_price(self, base='', quote=''):
+        return await self._run_async(self.get_price, base, quote)
+
+    async def aget_open_orders(self):
+        return await self._run_async(self.get_open_orders)
+
+    async def aget_account_balance(self, account_type=None):
+        return await self._run_async(self.get_account_balance, account_type)
+
+    async def aget_volume_by_interval(self, symbol_input, quote_input, interval, start_time):
+        return await self._run_async(self.get_volume_by_interval, symbol_input, quote_input, interval, start_time)
+
+    @classmethod
+    async def volumes_batch(cls, calls, sem_size=20):
+        """
+        Fetch get_volume_by_interval for many (symbol, interval) pairs concurrently.
+
+        Args:
+            calls (list): Tuples of (api, symbol_input, quote_input, interval, start_time),
+                          where api is a PoloniexPrivate instance.
+            sem_size (int, optional): Max requests in flight, keeps the burst under the
+                                      Poloniex rate limit. Default 20.
+
+        Returns:
+            list: Results in the same order as calls.
+        """
+        sem = asyncio.Semaphore(sem_size)
+
+        async def one(api, symbol_input, quote_input, interval, start_time):
+            async with sem:
+                return await api.aget_volume_by_interval(symbol_input, quote_input, interval, start_time)
+
+        return await asyncio.gather(*[one(*call) for call in calls])
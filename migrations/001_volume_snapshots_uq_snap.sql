@@ -0,0 +1,33 @@
+-- Unique key used by INSERT ... ON DUPLICATE KEY UPDATE in database_mm._write_volume_snapshots.
+-- Until it exists the writers fall back to a per-row Redis lock (vslock:) + SELECT-then-write.
+-- Run once, during a quiet window: existing duplicates are merged into their lowest id first.
+
+START TRANSACTION;
+
+UPDATE volume_snapshots keep_row
+JOIN (
+    SELECT MIN(id) AS id, SUM(base_volume) AS base_volume, SUM(quote_volume) AS quote_volume,
+           SUM(usd_volume) AS usd_volume, MAX(updated_at) AS updated_at
+    FROM volume_snapshots
+    GROUP BY strategy_name, exchange, base_symbol, quote_symbol, time_stamp
+    HAVING COUNT(*) > 1
+) merged ON merged.id = keep_row.id
+SET keep_row.base_volume = merged.base_volume,
+    keep_row.quote_volume = merged.quote_volume,
+    keep_row.usd_volume = merged.usd_volume,
+    keep_row.updated_at = merged.updated_at;
+
+DELETE duplicate_row
+FROM volume_snapshots duplicate_row
+JOIN volume_snapshots keep_row
+  ON keep_row.strategy_name = duplicate_row.strategy_name
+ AND keep_row.exchange = duplicate_row.exchange
+ AND keep_row.base_symbol = duplicate_row.base_symbol
+ AND keep_row.quote_symbol = duplicate_row.quote_symbol
+ AND keep_row.time_stamp = duplicate_row.time_stamp
+ AND keep_row.id < duplicate_row.id;
+
+COMMIT;
+
+ALTER TABLE volume_snapshots
+    ADD UNIQUE KEY uq_snap (strategy_name, exchange, base_symbol, quote_symbol, time_stamp);
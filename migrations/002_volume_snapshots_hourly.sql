@@ -0,0 +1,14 @@
+-- Hourly rollup of volume_snapshots, filled by database_mm.rollup_volume_snapshots_hourly
+-- (scheduled by start_volume_rollup_scheduler) and read by _sum_volume_snapshots_hourly.
+-- hour is the unix second at the start of the hour. Safe to run more than once.
+
+CREATE TABLE IF NOT EXISTS volume_snapshots_hourly (
+    exchange VARCHAR(64) NOT NULL,
+    base_symbol VARCHAR(32) NOT NULL,
+    quote_symbol VARCHAR(32) NOT NULL,
+    strategy_name VARCHAR(255) NOT NULL,
+    hour INT NOT NULL,
+    usd_volume_sum DECIMAL(30, 8) NOT NULL,
+    PRIMARY KEY (exchange, base_symbol, quote_symbol, strategy_name, hour),
+    KEY idx_vsh_lookup (exchange, base_symbol, quote_symbol, hour, strategy_name, usd_volume_sum)
+);
@@ -15,10 +15,15 @@ Result format:
 """
 import os
 import json
+import functools
 import sys
 import time
 from typing import Dict, Any, List, Tuple
 
+import numpy as np
+import pandas as pd
+import redis
+
 try:
     import requests
 except Exception:
@@ -34,6 +39,18 @@ from exchange_api_spot.user import get_client_exchange
 
 from decimal import Decimal, ROUND_DOWN,ROUND_UP
 
+# In-process price cache: (exchange, base, quote) -> (price, fetched_at)
+PRICE_TTL = int(os.environ.get("PRICE_CACHE_TTL_SEC", "45"))
+_price_cache: Dict[Tuple[str, str, str], Tuple[float, float]] = {}
+# Public-data clients by (exchange, base); only non-None clients are stored
+_price_clients: Dict[Tuple[str, str], Any] = {}
+
+# Shared price cache so concurrent result checkers hit the exchange once per TTL window
+r = redis.Redis(host='localhost', port=6379, decode_responses=True)
+PRICE_LOCK_MS = 2000
+
+# Signed direction of an order's quantity; unknown sides contribute nothing
+_SIDE_SIGN = {"BUY": 1.0, "SELL": -1.0}
 
 def env(name: str, default: str = "") -> str:
     v = os.environ.get(name)
@@ -86,6 +103,25 @@ def fetch_last_balance(base_url: str, session_key: str) -> Dict[str, Any]:
     }
 
 
+def to_float(v) -> float:
+    """
+    Convert an API value to float, returning 0.0 for None or unparsable input.
+    Exact type checks return float/int input directly; only strings and other types reach the try.
+    """
+    if v is None:
+        return 0.0
+    t = type(v)
+    if t is float:
+        return v
+    if t is int:
+        return float(v)
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_symbol(symbol: str) -> Tuple[str, str, str]:
     s = (symbol or '').strip().upper()
     if '/' in s:
@@ -98,6 +134,52 @@ def parse_symbol(symbol: str) -> Tuple[str, str, str]:
     return s or 'BTC', 'USDT', f"{(s or 'BTC')}USDT"
 
 
+def _get_price_client(exchange: str, base: str):
+    """
+    Build one public-data client per (exchange, base) for the life of the process.
+    The dummy api_key carries the pair because get_client_exchange caches clients by api_key.
+    Only successfully built clients are kept, so an unsupported exchange or a failed
+    constructor is retried on the next call instead of being cached.
+    """
+    client = _price_clients.get((exchange, base))
+    if client is not None:
+        return client
+    # Provide dummy credentials for price fetching (public data doesn't need real credentials)
+    dummy_acc_info = {
+        'api_key': f'dummy_key_for_price_{exchange}_{base}',
+        'secret_key': 'dummy_secret_for_price',
+        'passphrase': ''
+    }
+    client = get_client_exchange(
+        exchange_name=exchange,
+        acc_info=dummy_acc_info,
+        symbol=base,
+        quote="USDT",
+        session_key="price_check",
+    )
+    if client is not None:
+        _price_clients[(exchange, base)] = client
+    return client
+
+
+def _get_shared_price(redis_key: str):
+    """Read a price from the shared Redis cache, None on miss or Redis error"""
+    try:
+        value = r.get(redis_key)
+        return to_float(value) if value is not None else None
+    except Exception as e:
+        logger_error.error(f"Error reading cached price {redis_key}: {str(e)}")
+        return None
+
+
+def _acquire_price_lock(redis_key: str) -> bool:
+    """Take the short fetch lock for a price key; True when Redis is unavailable so callers still fetch"""
+    try:
+        return bool(r.set(f"{redis_key}:lock", 1, nx=True, px=PRICE_LOCK_MS))
+    except Exception:
+        return True
+
+
 def get_current_price(symbol: str, exchange: str) -> float:
     """
     Get current market price for a symbol from the exchange.
@@ -109,27 +191,39 @@ def get_current_price(symbol: str, exchange: str) -> float:
     Returns:
         Current price or 0.0 if unable to fetch
     """
+    base = symbol.split("_")[0]
+    cache_key = (exchange, base, "USDT")
+    cached = _price_cache.get(cache_key)
+    if cached is not None and time.time() - cached[1] < PRICE_TTL:
+        return cached[0]
+
+    redis_key = f"px:{exchange}:{base}:USDT"
+    shared = _get_shared_price(redis_key)
+    if shared is None and not _acquire_price_lock(redis_key):
+        # Another process is fetching this price; give it a moment before fetching ourselves
+        time.sleep(0.2)
+        shared = _get_shared_price(redis_key)
+    if shared is not None:
+        _price_cache[cache_key] = (shared, time.time())
+        return shared
+
     try:
         # Try to get exchange client to fetch current price
         logger_access.info("symbol 1: ",symbol.split("_")[0])
-        # Provide dummy credentials for price fetching (public data doesn't need real credentials)
-        dummy_acc_info = {
-            'api_key': 'dummy_key_for_price',
-            'secret_key': 'dummy_secret_for_price',
-            'passphrase': ''
-        }
-        client = get_client_exchange(
-            exchange_name=exchange,
-            acc_info=dummy_acc_info,
-            symbol=symbol.split("_")[0],  # Extract base symbol
-            quote="USDT",
-            session_key="price_check",
-        )
+        client = _get_price_client(exchange, base)
         
         if client and hasattr(client, 'get_price'):
             price_data = client.get_price()
             if price_data and 'price' in price_data:
-                return float(price_data['price'])
+                price = to_float(price_data['price'])
+                # Error responses come back as price "0"; only cache real quotes
+                if price > 0:
+                    _price_cache[cache_key] = (price, time.time())
+                    try:
+                        r.setex(redis_key, PRICE_TTL, price)
+                    except Exception as e:
+                        logger_error.error(f"Error caching price {redis_key}: {str(e)}")
+                return price
         
         # Fallback: use a default current price (you can modify this)
         logger_database.info(f"Could not fetch current price for {symbol}, using default")
@@ -202,42 +296,66 @@ def create_opposite_paper_order(session_key: str, symbol: str, total_qty: float,
         return False
 
 
+def _numeric_column(frame: pd.DataFrame, *names: str) -> np.ndarray:
+    """
+    Coerce order fields to float64 in bulk, with the same fallback as `o.get(a) or o.get(b) or 0`:
+    a missing key, None/NaN, "" or a numeric zero falls through to the next name, while a
+    non-empty string such as "0" is truthy and kept. Unparsable strings count as 0.
+    """
+    values = np.zeros(len(frame), dtype=np.float64)
+    for name in reversed(names):
+        if name in frame:
+            raw = frame[name]
+            col = pd.to_numeric(raw, errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+            if pd.api.types.is_numeric_dtype(raw.dtype):
+                is_text = np.zeros(len(raw), dtype=bool)
+            else:
+                # Chuỗi khác rỗng luôn "có mặt" kể cả "0"; số 0 thì rơi xuống field tiếp theo
+                is_text = raw.map(lambda v: isinstance(v, str) and v != "").to_numpy(dtype=bool)
+            present = raw.notna().to_numpy() & (is_text | (col != 0))
+            values = np.where(present, col, values)
+    return values
+
+
 def compute_balance(initial_balance: float, orders: List[Dict[str, Any]], session_key: str = "") -> Dict[str, Any]:
     cash = 1000.0  # Fixed cash amount - always 1000 USDT
     positions: Dict[str, Dict[str, float]] = {}
-    last_trade_price: Dict[str, float] = {}
+
+    # No orders yet: balance is just the starting cash, skip the order/price pipeline
+    if not orders:
+        return {
+            "success": True,
+            "balances": {"USDT": {"amount": cash}, "Total": cash},
+            "exchange": "binance",
+            "orders_count": 0,
+        }
 
     # Infer exchange from orders (optional)
     exchange = (orders[0].get("exchange") if orders else "binance") or "binance"
 
-    # Calculate cash flow and positions from orders
-    sum_money_of_orders = 0.0  # Total money spent/received from orders
-    
-    for o in orders:
-        sym = (o.get("symbol") or "").upper()
-        side = (o.get("side") or o.get("Side") or "").upper()
-        qty = float(o.get("filled_quantity") or o.get("quantity") or 0)
-        price = float(o.get("avg_price") or o.get("price") or 0)
-        fee = float(o.get("fee") or 0)
-
-        if price > 0:
-            last_trade_price[sym] = price
-
-        if sym not in positions:
-            positions[sym] = {"qty": 0.0}
-
-        sum_money_of_orders -= 2*fee # 2 times fee to account for both buy and sell fees
-
-        if side == "BUY":
-            # Don't modify cash - keep it at 1000 USDT
-            positions[sym]["qty"] += qty
-            sum_money_of_orders += -qty * price  # Money spent on buying
-        elif side == "SELL":
-            # Don't modify cash - keep it at 1000 USDT
-            positions[sym]["qty"] += -qty
-            sum_money_of_orders += qty * price   # Money received from selling (negative)
-        else:
-            continue
+    # Gather order fields into parallel arrays so the cash flow and positions
+    # are reduced in numpy instead of a per-order Python loop
+    n = len(orders)
+    symbols = [(o.get("symbol") or "").upper() for o in orders]
+    sign = np.fromiter((_SIDE_SIGN.get((o.get("side") or o.get("Side") or "").upper(), 0.0) for o in orders),
+                       dtype=np.float64, count=n)
+    frame = pd.DataFrame(orders)
+    qty = _numeric_column(frame, "filled_quantity", "quantity")
+    price = _numeric_column(frame, "avg_price", "price")
+    fee = _numeric_column(frame, "fee")
+
+    # Total money spent/received from orders: buys spend qty*price, sells receive it.
+    # 2 times fee to account for both buy and sell fees
+    signed_qty = sign * qty
+    sum_money_of_orders = float(-2.0 * fee.sum() - np.dot(signed_qty, price))
+
+    # Net quantity per symbol, keeping first-seen symbol order
+    symbol_index = {sym: i for i, sym in enumerate(dict.fromkeys(symbols))}
+    if n:
+        inverse = np.fromiter((symbol_index[sym] for sym in symbols), dtype=np.intp, count=n)
+        net_qty = np.bincount(inverse, weights=signed_qty, minlength=len(symbol_index))
+        for sym, i in symbol_index.items():
+            positions[sym] = {"qty": float(net_qty[i])}
 
     balances: Dict[str, Any] = {}
     
@@ -332,7 +450,7 @@ def main():
         payload = fetch_last_balance(base_url, session_key)
         if not payload.get("success"):
             raise RuntimeError(payload)
-        initial_balance = float(payload.get("initial_balance") or 0)
+        initial_balance = to_float(payload.get("initial_balance"))
         orders = payload.get("orders") or []
         logger_access.info(f"order is:: {orders}")
 
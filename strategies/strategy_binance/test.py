@@ -100,7 +100,8 @@ class BTCTestStrategy:
                 get_line_number(),
                 "BINANCE",
                 "test-strategy.py",
-                f"Error getting price: {e}"
+                f"Error getting price: {e}",
+                queued=True
             )
             return None
 
@@ -137,7 +138,8 @@ class BTCTestStrategy:
                 get_line_number(),
                 "BINANCE",
                 "test-strategy.py",
-                f"Error checking balance: {e}"
+                f"Error checking balance: {e}",
+                queued=True
             )
             return 0
 
@@ -194,7 +196,8 @@ class BTCTestStrategy:
                 get_line_number(),
                 "BINANCE",
                 "test-strategy.py",
-                f"Error placing order: {e}"
+                f"Error placing order: {e}",
+                queued=True
             )
             return False
 
@@ -253,7 +256,8 @@ class BTCTestStrategy:
                 self.symbol,
                 get_line_number(),
                 "test-strategy.py",
-                f"Strategy error: {e}"
+                f"Strategy error: {e}",
+                queued=True
             )
             return False
 
@@ -115,7 +115,8 @@ class BTCTestStrategy:
                 get_line_number(),
                 "POLONIEX",
                 "test-strategy.py",
-                f"Error getting price: {e}"
+                f"Error getting price: {e}",
+                queued=True
             )
             return None
 
@@ -152,7 +153,8 @@ class BTCTestStrategy:
                 get_line_number(),
                 "POLONIEX",
                 "test-strategy.py",
-                f"Error checking balance: {e}"
+                f"Error checking balance: {e}",
+                queued=True
             )
             return 0
 
@@ -208,7 +210,8 @@ class BTCTestStrategy:
                 get_line_number(),
                 "POLONIEX",
                 "test-strategy.py",
-                f"Error placing order: {e}"
+                f"Error placing order: {e}",
+                queued=True
             )
             return False
 
@@ -258,7 +261,8 @@ class BTCTestStrategy:
                 self.symbol,
                 get_line_number(),
                 "test-strategy.py",
-                f"Strategy error: {e}"
+                f"Strategy error: {e}",
+                queued=True
             )
             return False
 
@@ -13,6 +13,7 @@ from pathlib import Path
 from logger import logger_access, logger_error
 from utils import get_arg
 from constants import set_constants, get_constants
+from database_mm import start_volume_rollup_scheduler
 
 def configure_matplotlib_for_notebook():
     """Configure matplotlib for notebook execution (plots will be embedded in notebook)"""
@@ -345,6 +346,9 @@ def main():
 
     params = get_constants()
 
+    # Rolls volume_snapshots up into volume_snapshots_hourly; a Redis lock keeps it to one worker per interval
+    start_volume_rollup_scheduler()
+
     logger_access.info("\n" + "=" * 50)
     logger_access.info("🌍 Hello World from Python Strategy Runner!")
     logger_access.info("=" * 50)
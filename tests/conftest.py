@@ -0,0 +1,169 @@
+import os
+import sys
+
+import pytest
+
+# Module tests import top-level modules (database_mm, result.paper_trade, ...) from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _require_db_deps():
+    """Skips the calling test unless database_mm's drivers are installed."""
+    for name in ("redis", "mysql.connector", "dotenv"):
+        pytest.importorskip(name)
+    try:
+        import MySQLdb  # noqa: F401
+    except ImportError:
+        pytest.importorskip("pymysql")
+
+
+@pytest.fixture
+def database_mm():
+    _require_db_deps()
+    import database_mm as module
+    return module
+
+
+class FakeRedis:
+    """In-memory stand-in for the handful of redis.Redis calls used by database_mm."""
+
+    def __init__(self):
+        self.store = {}
+        self.hashes = {}
+        self.sets = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        return True
+
+    def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += int(self.store.pop(key, None) is not None)
+            removed += int(self.hashes.pop(key, None) is not None)
+            removed += int(self.sets.pop(key, None) is not None)
+        return removed
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        data = self.hashes.setdefault(key, {})
+        if mapping:
+            data.update({k: str(v) for k, v in mapping.items()})
+        if field is not None:
+            data[field] = str(value)
+        return 1
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def expire(self, key, ttl):
+        return True
+
+    def sadd(self, key, *members):
+        data = self.sets.setdefault(key, set())
+        added = len(set(members) - data)
+        data.update(members)
+        return added
+
+    def sismember(self, key, member):
+        return member in self.sets.get(key, set())
+
+    def spop(self, key, count=None):
+        data = self.sets.get(key, set())
+        # Sorted so tests see a stable order
+        popped = sorted(data)[:count or 1]
+        data.difference_update(popped)
+        return popped if count is not None else (popped[0] if popped else None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis calls and runs them in order on execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def queue_call(*args, **kwargs):
+            self.calls.append((method, args, kwargs))
+            return self
+        return queue_call
+
+    def execute(self):
+        calls, self.calls = self.calls, []
+        return [method(*args, **kwargs) for method, args, kwargs in calls]
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+class FakeCursor:
+    """Records execute/executemany calls; fetch* return the queued results in order."""
+
+    def __init__(self, results=None):
+        self.executed = []
+        self.results = list(results or [])
+        self.lastrowid = None
+        self.rowcount = 1
+
+    def execute(self, query, params=None):
+        self.executed.append((" ".join(query.split()), params))
+
+    def executemany(self, query, rows):
+        self.executed.append((" ".join(query.split()), list(rows)))
+
+    def fetchone(self):
+        return self.results.pop(0) if self.results else None
+
+    def fetchall(self):
+        return self.results.pop(0) if self.results else []
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_db(database_mm, monkeypatch):
+    """Routes database_mm.get_connection to an in-memory cursor and returns that cursor."""
+    cursor = FakeCursor()
+    connection = FakeConnection()
+    monkeypatch.setattr(database_mm, "get_connection", lambda: (connection, cursor))
+    monkeypatch.setattr(database_mm, "close_connection", lambda conn, cur: None)
+    cursor.connection = connection
+    return cursor
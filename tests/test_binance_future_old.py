@@ -0,0 +1,96 @@
+from decimal import Decimal
+from urllib.parse import urlencode
+
+import pytest
+
+for _name in ("requests", "redis", "urllib3"):
+    pytest.importorskip(_name)
+binance_future_old = pytest.importorskip("exchange_api_future.binance_future.binance_future_old")
+Client = binance_future_old.BinanceFuturesOldPrivate
+
+
+class DictRedis:
+    """Minimal get/set/delete/pipeline store for the client's read-through cache."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, px=None):
+        self.store[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Known scale: the constructor must not download exchangeInfo
+    monkeypatch.setitem(binance_future_old._SCALE_TABLE, "BTCUSDT", (2, 3))
+    return Client("BTC", api_key="key", secret_key="secret", redis_client=DictRedis())
+
+
+def test_close_position_reads_live_position_and_reduces_only(client, monkeypatch):
+    # A cached position that no longer matches the exchange
+    client.redis_client.set(client._account_cache_key("positionRisk"),
+                            b'{"symbol": "BTCUSDT", "positionAmt": "5"}')
+    requests_sent = []
+    orders = []
+
+    def fake_send(self, method, url, params=None, signed=False):
+        requests_sent.append(url)
+        return [{"symbol": "BTCUSDT", "positionAmt": "-0.25"}]
+
+    monkeypatch.setattr(Client, "_send_request", fake_send)
+    monkeypatch.setattr(Client, "place_order", lambda self, **kwargs: orders.append(kwargs) or {"orderId": 1})
+
+    assert client.close_position() == {"orderId": 1}
+    assert requests_sent == [client._urls["positionRisk"]]
+    assert orders == [{"order_side": "BUY", "quantity": 0.25, "order_type": "MARKET", "reduce_only": True}]
+
+
+def test_account_wide_cache_keys_are_shared_across_symbols(client, monkeypatch):
+    monkeypatch.setitem(binance_future_old._SCALE_TABLE, "ETHUSDT", (2, 3))
+    other = Client("ETH", api_key="key", secret_key="secret", redis_client=client.redis_client)
+
+    for endpoint in ("account", "balance"):
+        assert client._account_cache_key(endpoint) == other._account_cache_key(endpoint)
+        assert "BTCUSDT" not in client._account_cache_key(endpoint)
+    assert client._account_cache_key("positionRisk") != other._account_cache_key("positionRisk")
+
+
+def test_invalidate_account_cache_drops_shared_balance(client, monkeypatch):
+    monkeypatch.setitem(binance_future_old._SCALE_TABLE, "ETHUSDT", (2, 3))
+    other = Client("ETH", api_key="key", secret_key="secret", redis_client=client.redis_client)
+    store = client.redis_client.store
+    for endpoint in ("account", "balance", "positionRisk"):
+        store[other._account_cache_key(endpoint)] = b"{}"
+
+    client._invalidate_account_cache()
+
+    assert other._account_cache_key("balance") not in store
+    assert other._account_cache_key("account") not in store
+    assert other._account_cache_key("positionRisk") in store
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"symbol": "BTCUSDT"},
+    {"symbol": "ETHUSDT", "limit": 500},
+    {"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "quantity": 0.001, "price": 65000.5,
+     "timeInForce": "GTC", "reduceOnly": "true"},
+    {"quantity": 1e-05, "price": -1, "startTime": 1700000000000, "flag": True, "none": None},
+    {"newClientOrderId": "x-abc/def+ghi=1&2 3", "note": "tiếng Việt", "amount": Decimal("1.50")},
+    {"symbol": "BTC USDT", "list": [1, 2]},
+])
+def test_encode_params_matches_urlencode(client, params):
+    assert client._encode_params(params) == urlencode(params)
@@ -0,0 +1,21 @@
+def test_insert_error_logger_writes_repeated_error_once(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+
+    for _ in range(3):
+        assert database_mm.insert_error_logger("strategy.py", 42, "Error getting price: timeout") is None
+    database_mm.insert_error_logger("strategy.py", 42, "Error checking balance: timeout")
+
+    inserts = [params for query, params in fake_db.executed if query.startswith("INSERT INTO error_loggers")]
+    assert [params[2] for params in inserts] == ["Error getting price: timeout", "Error checking balance: timeout"]
+
+
+def test_insert_error_logger_writes_when_redis_is_down(database_mm, fake_db, fake_redis, monkeypatch):
+    def broken_pipeline(transaction=True):
+        raise ConnectionError("redis down")
+    monkeypatch.setattr(fake_redis, "pipeline", broken_pipeline)
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+
+    database_mm.insert_error_logger("strategy.py", 42, "boom")
+    database_mm.insert_error_logger("strategy.py", 42, "boom")
+
+    assert sum(query.startswith("INSERT INTO error_loggers") for query, _ in fake_db.executed) == 2
@@ -0,0 +1,33 @@
+import datetime
+import decimal
+
+ROW = (42, "mm", decimal.Decimal("1250.50000000"), datetime.datetime(2024, 5, 1, 12, 30, 5),
+       datetime.date(2024, 5, 1), None)
+
+
+def test_inflow_get_last_row_miss_returns_driver_row(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    fake_db.results.append(ROW)
+
+    assert database_mm.inflow_get_last_row() == ROW
+    assert database_mm.INFLOW_LAST_ROW_KEY in fake_redis.store
+
+
+def test_inflow_get_last_row_hit_restores_column_types(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    fake_db.results.append(ROW)
+    database_mm.inflow_get_last_row()
+
+    cached = database_mm.inflow_get_last_row()
+
+    assert len(fake_db.executed) == 1, "second read should come from Redis"
+    assert cached == ROW
+    assert [type(value) for value in cached] == [type(value) for value in ROW]
+
+
+def test_inflow_get_last_row_caches_empty_table(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+
+    assert database_mm.inflow_get_last_row() is None
+    assert database_mm.inflow_get_last_row() is None
+    assert len(fake_db.executed) == 1
@@ -0,0 +1,303 @@
+import time
+
+import pytest
+
+
+SNAPSHOT = {
+    'time_stamp': 1700000000, 'strategy_name': 'mm', 'exchange': 'binance', 'base_symbol': 'BTC',
+    'quote_symbol': 'USDT', 'price': 100.0, 'quote_price': 1.0, 'base_volume': 2.0, 'quote_volume': 200.0,
+    'usd_volume': 200.0, 'created_at': '2023-11-14 22:13:20', 'updated_at': '2023-11-14 22:13:20',
+}
+
+UQ_SNAP_INDEXES = [("PRIMARY", "id"), ("uq_snap", "strategy_name,exchange,base_symbol,quote_symbol,time_stamp")]
+
+
+@pytest.fixture(autouse=True)
+def upsert_schema(database_mm, monkeypatch):
+    """Most tests run against a schema with uq_snap; the fallback tests reset the flag."""
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", True)
+
+
+def test_insert_volume_snapshots_writes_through_upsert(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+
+    assert database_mm.insert_volume_snapshots(dict(SNAPSHOT)) is None
+
+    queries = [query for query, _ in fake_db.executed]
+    assert len(queries) == 1
+    assert queries[0].startswith("INSERT INTO volume_snapshots")
+    assert "ON DUPLICATE KEY UPDATE" in queries[0]
+    assert "base_volume = base_volume + VALUES(base_volume)" in queries[0]
+    assert fake_db.executed[0][1] == list(database_mm._volume_snapshot_row(SNAPSHOT))
+    assert fake_db.connection.commits == 1
+
+
+def test_insert_volume_snapshots_ignores_stale_vs_hash(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    # Left over from the old insert-vs-update cache, pointing at a newer row than the one being written
+    fake_redis.hset("vs:mm:binance:BTC:USDT", mapping={'id': 7, 'time_stamp': SNAPSHOT['time_stamp'] + 60})
+
+    assert database_mm.insert_volume_snapshots(dict(SNAPSHOT)) is None
+
+    (query, params), = fake_db.executed
+    assert "ON DUPLICATE KEY UPDATE" in query
+    assert params[0] == SNAPSHOT['time_stamp']
+
+
+def test_v1_and_v2_send_the_same_upsert(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT))
+    database_mm.insert_volume_snapshots_v2(dict(SNAPSHOT))
+
+    assert fake_db.executed[0] == fake_db.executed[1]
+
+
+def test_insert_volume_snapshots_takes_no_redis_lock(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT))
+
+    assert fake_redis.store == {}
+    assert fake_redis.hashes == {}
+
+
+def _settled_hour(hours_back=3):
+    return int(time.time()) // 3600 - hours_back
+
+
+def test_late_snapshot_invalidates_cached_hour(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    hour = _settled_hour()
+    key = database_mm._wash_volume_hour_key('binance', 'BTC', 'USDT', hour)
+    fake_redis.hset(key, mapping={'*': 12.0})
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT, time_stamp=hour * 3600 + 10))
+
+    assert key not in fake_redis.hashes
+
+
+def test_current_hour_snapshot_leaves_cache_alone(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    now = int(time.time())
+    key = database_mm._wash_volume_hour_key('binance', 'BTC', 'USDT', now // 3600)
+    fake_redis.hset(key, mapping={'*': 1.0})
+
+    database_mm.insert_volume_snapshots_v2(dict(SNAPSHOT, time_stamp=now))
+
+    assert key in fake_redis.hashes
+
+
+def test_hourly_sum_counts_late_write_to_cached_hour(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    hour = _settled_hour()
+    from_time, to_time = (hour - 1) * 3600, (hour + 1) * 3600 - 1
+
+    def wash_volume():
+        return database_mm._sum_volume_snapshots_hourly(fake_db, [], 'binance', 'BTC', 'USDT', from_time, to_time)
+
+    fake_db.results.append([(hour - 1, 5.0), (hour, 7.0)])
+    assert wash_volume() == 12.0
+    queries = len(fake_db.executed)
+    assert wash_volume() == 12.0
+    assert len(fake_db.executed) == queries, "settled hours should be served from Redis"
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT, time_stamp=hour * 3600 + 10, usd_volume=2.0))
+    fake_db.results.append([(hour, 9.0)])
+
+    assert wash_volume() == 14.0
+    assert fake_db.executed[-1][1][-2:] == [hour * 3600, (hour + 1) * 3600]
+
+
+def test_late_write_below_rollup_watermark_is_read_raw_then_repaired(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    hour = _settled_hour()
+    key = database_mm._wash_volume_hour_key('binance', 'BTC', 'USDT', hour)
+    # The rollup already covers this hour
+    fake_redis.set(database_mm.VOLUME_HOURLY_WATERMARK_KEY, str((hour + 1) * 3600))
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT, time_stamp=hour * 3600 + 10))
+    assert fake_redis.sismember(database_mm.VOLUME_HOURLY_DIRTY_KEY, key)
+
+    fake_db.results.append([(hour, 9.0)])
+    assert database_mm._sum_volume_snapshots_hourly(fake_db, [], 'binance', 'BTC', 'USDT',
+                                                    hour * 3600, (hour + 1) * 3600 - 1) == 9.0
+    assert "FROM volume_snapshots WHERE" in fake_db.executed[-1][0], "dirty hour must skip the stale rollup"
+
+    fake_db.results.append(((hour + 1) * 3600,))
+    assert database_mm.rollup_volume_snapshots_hourly() >= (hour + 1) * 3600
+
+    repair_query, repair_params = fake_db.executed[-1]
+    assert repair_query.startswith("INSERT INTO volume_snapshots_hourly")
+    assert repair_params == (hour * 3600, 'binance', 'BTC', 'USDT', hour * 3600, (hour + 1) * 3600)
+    assert not fake_redis.sismember(database_mm.VOLUME_HOURLY_DIRTY_KEY, key)
+    assert key not in fake_redis.hashes
+
+
+def test_dirty_hour_is_read_alone_not_the_whole_span(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    hour = _settled_hour()
+    fake_redis.set(database_mm.VOLUME_HOURLY_WATERMARK_KEY, str((hour + 1) * 3600))
+    fake_redis.sadd(database_mm.VOLUME_HOURLY_DIRTY_KEY,
+                    database_mm._wash_volume_hour_key('binance', 'BTC', 'USDT', hour - 2))
+
+    fake_db.results.append([(hour - 3, 1.0), (hour - 1, 2.0), (hour, 3.0)])
+    fake_db.results.append([(hour - 2, 4.0)])
+    assert database_mm._sum_volume_snapshots_hourly(fake_db, [], 'binance', 'BTC', 'USDT',
+                                                    (hour - 3) * 3600, (hour + 1) * 3600 - 1) == 10.0
+
+    (rolled_query, rolled_params), (raw_query, raw_params) = fake_db.executed[-2:]
+    assert "hour IN (%s, %s, %s)" in rolled_query
+    assert rolled_params[-3:] == [(hour - 3) * 3600, (hour - 1) * 3600, hour * 3600]
+    assert raw_query.count("time_stamp >= %s AND time_stamp < %s") == 1
+    assert raw_params[-2:] == [(hour - 2) * 3600, (hour - 1) * 3600]
+
+
+def test_contiguous_hour_runs(database_mm):
+    assert database_mm._contiguous_hour_runs([]) == []
+    assert database_mm._contiguous_hour_runs([3, 4, 5, 9, 11, 12]) == [(3, 6), (9, 10), (11, 13)]
+
+
+def test_unique_key_is_detected_once(database_mm, fake_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", None)
+    fake_db.results.append(UQ_SNAP_INDEXES)
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT))
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT))
+
+    queries = [query for query, _ in fake_db.executed]
+    assert "information_schema.STATISTICS" in queries[0]
+    assert all("ON DUPLICATE KEY UPDATE" in query for query in queries[1:])
+    assert len(queries) == 3
+
+
+@pytest.fixture
+def redis_locks(database_mm, fake_redis, monkeypatch):
+    """Routes the compare-and-delete release script to the fake store."""
+    def release(keys, args):
+        if fake_redis.store.get(keys[0]) == args[0]:
+            del fake_redis.store[keys[0]]
+    monkeypatch.setattr(database_mm, "r", fake_redis)
+    monkeypatch.setattr(database_mm, "_release_lock_script", release)
+    return fake_redis
+
+
+def test_without_unique_key_inserts_missing_row(database_mm, fake_db, redis_locks, monkeypatch):
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", None)
+    fake_db.results.append([("PRIMARY", "id")])
+    fake_db.lastrowid = 41
+    taken = []
+    acquire = database_mm._acquire_lock
+    monkeypatch.setattr(database_mm, "_acquire_lock", lambda key: taken.append(key) or acquire(key))
+
+    assert database_mm.insert_volume_snapshots(dict(SNAPSHOT)) is None
+
+    queries = [query for query, _ in fake_db.executed]
+    assert queries[1].startswith("SELECT id, time_stamp FROM volume_snapshots")
+    assert queries[2].startswith("INSERT INTO volume_snapshots") and "ON DUPLICATE KEY" not in queries[2]
+    assert not any("LOCK TABLES" in query for query in queries)
+    assert taken == ["vslock:mm:binance:BTC:USDT"]
+    assert "vslock:mm:binance:BTC:USDT" not in redis_locks.store, "lock must be released"
+    assert database_mm._volume_snapshot_has_unique_key is False
+    assert redis_locks.hashes["vs:mm:binance:BTC:USDT"] == {'id': '41', 'time_stamp': str(SNAPSHOT['time_stamp'])}
+
+
+def test_without_unique_key_adds_to_existing_row(database_mm, fake_db, redis_locks, monkeypatch):
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", False)
+    fake_db.results.append((7, SNAPSHOT['time_stamp']))
+
+    assert database_mm.insert_volume_snapshots_v2(dict(SNAPSHOT)) is None
+
+    update_query, update_params = fake_db.executed[1]
+    assert update_query.startswith("UPDATE volume_snapshots SET")
+    assert "base_volume = base_volume + %s" in update_query
+    assert update_params[-1] == 7
+    assert not any(query.startswith("INSERT") for query, _ in fake_db.executed)
+
+
+def test_without_unique_key_does_not_write_unlocked(database_mm, fake_db, redis_locks, monkeypatch):
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", False)
+    monkeypatch.setattr(database_mm, "_acquire_lock", lambda key: None)
+
+    assert isinstance(database_mm.insert_volume_snapshots(dict(SNAPSHOT)), TimeoutError)
+    assert fake_db.executed == []
+
+
+def test_flush_rebuffers_only_uncommitted_buckets(database_mm, fake_db, redis_locks, monkeypatch):
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", False)
+    first = {k: str(v) for k, v in SNAPSHOT.items()}
+    second = dict(first, base_symbol='ETH')
+    redis_locks.hashes.update({"vsbuf:a": first, "vsbuf:b": second})
+    redis_locks.sadd(database_mm.VOLUME_SNAPSHOT_BUFFER_DIRTY_KEY, "vsbuf:a", "vsbuf:b")
+    acquire = database_mm._acquire_lock
+    monkeypatch.setattr(database_mm, "_acquire_lock", lambda key: None if ":ETH:" in key else acquire(key))
+    rebuffered = []
+    monkeypatch.setattr(database_mm, "buffer_volume_snapshot", rebuffered.append)
+
+    assert isinstance(database_mm.flush_volume_snapshot_buffer(), TimeoutError)
+
+    assert rebuffered == [second]
+    assert fake_db.connection.commits == 1
+
+
+def _cache_last_row(fake_redis, row_id, time_stamp):
+    fake_redis.hset("vs:mm:binance:BTC:USDT", mapping={'id': row_id, 'time_stamp': time_stamp})
+
+
+def test_cached_bucket_is_updated_without_select(database_mm, fake_db, redis_locks, monkeypatch):
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", False)
+    _cache_last_row(redis_locks, 7, SNAPSHOT['time_stamp'])
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT))
+
+    (query, params), = fake_db.executed
+    assert query.startswith("UPDATE volume_snapshots") and params[-1] == 7
+
+
+def test_newer_bucket_is_inserted_without_select_and_cached(database_mm, fake_db, redis_locks, monkeypatch):
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", False)
+    _cache_last_row(redis_locks, 7, SNAPSHOT['time_stamp'] - 60)
+    fake_db.lastrowid = 8
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT))
+
+    (query, _), = fake_db.executed
+    assert query.startswith("INSERT INTO volume_snapshots")
+    assert redis_locks.hashes["vs:mm:binance:BTC:USDT"]['id'] == '8'
+
+
+def test_v2_and_flush_keep_the_cache_current(database_mm, fake_db, redis_locks, monkeypatch):
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", False)
+    _cache_last_row(redis_locks, 7, SNAPSHOT['time_stamp'])
+    fake_db.lastrowid = 8
+    newer = dict(SNAPSHOT, time_stamp=SNAPSHOT['time_stamp'] + 60)
+
+    database_mm.insert_volume_snapshots_v2(newer)
+    database_mm.insert_volume_snapshots(dict(newer))
+
+    assert [query.split()[0] for query, _ in fake_db.executed] == ["INSERT", "UPDATE"]
+    assert fake_db.executed[1][1][-1] == 8
+
+
+def test_older_bucket_and_vanished_row_fall_back_to_select(database_mm, fake_db, redis_locks, monkeypatch):
+    monkeypatch.setattr(database_mm, "_volume_snapshot_has_unique_key", False)
+    _cache_last_row(redis_locks, 7, SNAPSHOT['time_stamp'] + 60)
+    fake_db.results.append((3,))
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT))
+
+    assert fake_db.executed[0][0].startswith("SELECT id FROM volume_snapshots")
+    assert fake_db.executed[1][0].startswith("UPDATE") and fake_db.executed[1][1][-1] == 3
+    assert redis_locks.hashes["vs:mm:binance:BTC:USDT"]['id'] == '7'
+
+    # The cached row was merged away: UPDATE by id matches nothing
+    fake_db.executed.clear()
+    _cache_last_row(redis_locks, 7, SNAPSHOT['time_stamp'])
+    fake_db.rowcount = 0
+    fake_db.lastrowid = 9
+
+    database_mm.insert_volume_snapshots(dict(SNAPSHOT))
+
+    assert [query.split()[0] for query, _ in fake_db.executed] == ["UPDATE", "SELECT", "INSERT"]
+    assert redis_locks.hashes["vs:mm:binance:BTC:USDT"]['id'] == '9'
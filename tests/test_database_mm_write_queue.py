@@ -0,0 +1,67 @@
+import threading
+import time
+
+
+def _reset_writer(db):
+    db._write_stop.clear()
+    db._write_thread = None
+    while not db._write_queue.empty():
+        db._write_queue.get_nowait()
+
+
+def test_flush_write_queue_keeps_row_held_by_writer_thread(database_mm, monkeypatch):
+    db = database_mm
+    _reset_writer(db)
+    written = []
+    monkeypatch.setattr(db, "_write_batch", lambda batch: written.extend(batch))
+    # Long batching window: the writer pops the row and then waits
+    monkeypatch.setattr(db, "WRITE_QUEUE_FLUSH_SEC", 30)
+
+    db._enqueue_row("error_loggers", ("file.py", 1, "boom", "t", "t"))
+    deadline = time.time() + 2
+    while not db._write_queue.empty() and time.time() < deadline:
+        time.sleep(0.01)
+    assert db._write_queue.empty(), "writer thread should have taken the row"
+
+    started = time.time()
+    db.flush_write_queue()
+
+    assert written == [("error_loggers", ("file.py", 1, "boom", "t", "t"))]
+    assert time.time() - started < 5
+    assert not db._write_thread.is_alive()
+    _reset_writer(db)
+
+
+def test_flush_write_queue_waits_for_batch_in_progress(database_mm, monkeypatch):
+    db = database_mm
+    _reset_writer(db)
+    written = []
+    in_write = threading.Event()
+
+    def slow_write(batch):
+        in_write.set()
+        time.sleep(0.3)
+        written.extend(batch)
+
+    monkeypatch.setattr(db, "_write_batch", slow_write)
+    monkeypatch.setattr(db, "WRITE_QUEUE_FLUSH_SEC", 0)
+
+    db._enqueue_row("error_loggers", ("a.py", 1, "x", "t", "t"))
+    assert in_write.wait(2)
+    db.flush_write_queue()
+
+    assert written == [("error_loggers", ("a.py", 1, "x", "t", "t"))]
+    _reset_writer(db)
+
+
+def test_enqueue_after_shutdown_writes_synchronously(database_mm, monkeypatch):
+    db = database_mm
+    _reset_writer(db)
+    written = []
+    monkeypatch.setattr(db, "_write_batch", lambda batch: written.extend(batch))
+    db.flush_write_queue()
+
+    db._enqueue_row("error_loggers", ("late.py", 2, "y", "t", "t"))
+
+    assert written == [("error_loggers", ("late.py", 2, "y", "t", "t"))]
+    _reset_writer(db)
@@ -0,0 +1,82 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+paper_trade = pytest.importorskip("result.paper_trade")
+
+
+def _column(orders, *names):
+    return paper_trade._numeric_column(pd.DataFrame(orders), *names).tolist()
+
+
+def test_explicit_zero_string_is_not_replaced_by_fallback():
+    orders = [
+        {"filled_quantity": "0", "quantity": "5", "avg_price": "0", "price": "100"},
+        {"filled_quantity": "1.5", "quantity": "5", "avg_price": "101", "price": "100"},
+    ]
+
+    assert _column(orders, "filled_quantity", "quantity") == [0.0, 1.5]
+    assert _column(orders, "avg_price", "price") == [0.0, 101.0]
+
+
+def test_missing_none_and_empty_fall_back_to_next_name():
+    orders = [
+        {"quantity": "2"},
+        {"filled_quantity": None, "quantity": "3"},
+        {"filled_quantity": "", "quantity": "4"},
+        {"filled_quantity": "", "quantity": ""},
+    ]
+
+    assert _column(orders, "filled_quantity", "quantity") == [2.0, 3.0, 4.0, 0.0]
+
+
+def test_unparsable_values_count_as_zero():
+    orders = [{"fee": "n/a"}, {"fee": 0.25}, {}]
+
+    assert _column(orders, "fee") == [0.0, 0.25, 0.0]
+    assert _column(orders, "missing") == [0.0, 0.0, 0.0]
+
+
+def test_numeric_zero_falls_back_like_the_old_or_chain():
+    orders = [
+        {"filled_quantity": 0, "quantity": 5, "avg_price": 0.0, "price": 100.0},
+        {"filled_quantity": 0.0, "quantity": "2", "avg_price": "0", "price": 100.0},
+        {"filled_quantity": "0", "quantity": 5, "avg_price": 0, "price": "99.5"},
+    ]
+
+    assert _column(orders, "filled_quantity", "quantity") == [5.0, 2.0, 0.0]
+    assert _column(orders, "avg_price", "price") == [100.0, 0.0, 99.5]
+
+
+def _loop_balance(orders, current_price):
+    """compute_balance total as the per-order loop computed it before vectorisation."""
+    sum_money_of_orders = 0.0
+    net_qty = 0.0
+    for o in orders:
+        sign = {"BUY": 1.0, "SELL": -1.0}.get((o.get("side") or "").upper(), 0.0)
+        qty = float(o.get("filled_quantity") or o.get("quantity") or 0)
+        price = float(o.get("avg_price") or o.get("price") or 0)
+        fee = float(o.get("fee") or 0)
+        sum_money_of_orders += -2.0 * fee - sign * qty * price
+        net_qty += sign * qty
+    opposite = net_qty * current_price if abs(net_qty) > 1e-12 else 0.0
+    return round(1000.0 + sum_money_of_orders + opposite, 8)
+
+
+@pytest.mark.parametrize("orders", [
+    [
+        {"symbol": "BTCUSDT", "side": "BUY", "filled_quantity": 0, "quantity": 0.5, "avg_price": 0, "price": 100.0, "fee": 0},
+        {"symbol": "BTCUSDT", "side": "SELL", "filled_quantity": 0.2, "quantity": 0.5, "avg_price": 110.0, "price": 0.0, "fee": 0.1},
+    ],
+    [
+        {"symbol": "BTCUSDT", "side": "BUY", "filled_quantity": 0.0, "quantity": "0.3", "avg_price": 0.0, "price": "101", "fee": 0.0},
+        {"symbol": "BTCUSDT", "side": "BUY", "filled_quantity": "0", "quantity": 1, "avg_price": "0", "price": 100, "fee": "0.05"},
+        {"symbol": "BTCUSDT", "side": "SELL", "filled_quantity": None, "quantity": 0.1, "avg_price": "", "price": 105.0},
+    ],
+])
+def test_compute_balance_matches_per_order_loop_on_numeric_zeros(orders, monkeypatch):
+    monkeypatch.setattr(paper_trade, "get_current_price", lambda symbol, exchange: 120.0)
+
+    result = paper_trade.compute_balance(1000.0, orders)
+
+    assert result["balances"]["Total"] == pytest.approx(_loop_balance(orders, 120.0))
@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+paper_trade = pytest.importorskip("result.paper_trade")
+
+
+def test_price_client_is_not_cached_until_built(monkeypatch):
+    monkeypatch.setattr(paper_trade, "_price_clients", {})
+    built = []
+    results = [None, object()]
+
+    def get_client_exchange(**kwargs):
+        built.append(kwargs["exchange_name"])
+        return results.pop(0)
+
+    monkeypatch.setattr(paper_trade, "get_client_exchange", get_client_exchange)
+
+    assert paper_trade._get_price_client("binance", "BTC") is None
+    client = paper_trade._get_price_client("binance", "BTC")
+    assert client is not None
+    assert paper_trade._get_price_client("binance", "BTC") is client
+    assert built == ["binance", "binance"]
@@ -0,0 +1,38 @@
+import pytest
+
+for _name in ("requests", "redis", "pandas"):
+    pytest.importorskip(_name)
+poloniex_private = pytest.importorskip("exchange_api_spot.poloniex.poloniex_private")
+
+RAW_ORDER = {
+    "id": "21934611974062080",
+    "clientOrderId": "",
+    "symbol": "BTC_USDT",
+    "state": "NEW",
+    "side": "BUY",
+    "type": "LIMIT",
+    "timeInForce": "GTC",
+    "accountType": "SPOT",
+    "price": "18000.00",
+    "avgPrice": "0.00",
+    "quantity": "0.001",
+    "amount": "0",
+    "filledQuantity": "0",
+    "filledAmount": "0",
+    "createTime": 1646196019020,
+    "updateTime": 1646196019020,
+}
+
+
+def test_open_orders_keep_raw_fields_and_normalized_keys_win():
+    client = poloniex_private.PoloniexPrivate.__new__(poloniex_private.PoloniexPrivate)
+    client._request = lambda method, path, signed, params=None: [dict(RAW_ORDER)]
+
+    order = client.get_open_orders()["data"][0]
+
+    assert order["orderId"] == order["id"] == RAW_ORDER["id"]
+    assert order["fillQuantity"] == RAW_ORDER["filledQuantity"]
+    assert order["status"] == poloniex_private.convert_order_status("NEW")
+    assert order["orderType"] == "LIMIT"
+    # Raw fields the normalized dict does not cover are passed through
+    assert order["timeInForce"] == "GTC" and order["avgPrice"] == "0.00"
@@ -0,0 +1,32 @@
+import pytest
+
+
+@pytest.fixture
+def utils_general(database_mm, monkeypatch):
+    # utils/__init__ pulls in the exchange helpers (pandas, ...) before utils_general is usable
+    pytest.importorskip("utils")
+    from utils import utils_general as module
+    monkeypatch.setattr(module, "get_run_key_status", lambda run_key: "running")
+    return module
+
+
+def test_recoverable_errors_go_through_the_write_queue(utils_general, monkeypatch):
+    queued, inserted = [], []
+    monkeypatch.setattr(utils_general, "queue_error_logger", lambda **row: queued.append(row))
+    monkeypatch.setattr(utils_general, "insert_error_logger", lambda **row: inserted.append(row))
+
+    utils_general.update_key_and_insert_error_log("run-1", "BTC", 10, "BINANCE", "strategy.py",
+                                                  "Error getting price: timeout", queued=True)
+
+    assert len(queued) == 1 and inserted == []
+    assert "Error getting price: timeout" in queued[0]["content"]
+
+
+def test_fatal_errors_are_written_synchronously(utils_general, monkeypatch):
+    queued, inserted = [], []
+    monkeypatch.setattr(utils_general, "queue_error_logger", lambda **row: queued.append(row))
+    monkeypatch.setattr(utils_general, "insert_error_logger", lambda **row: inserted.append(row))
+
+    utils_general.update_key_and_insert_error_log("run-1", "BTC", 10, "BINANCE", "strategy.py", "Fatal error: boom")
+
+    assert queued == [] and len(inserted) == 1
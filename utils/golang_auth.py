@@ -8,10 +8,62 @@ import requests
 import json
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from logger import logger_error, logger_database, logger_access
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+
+def _json_dumps(data: Any) -> Optional[bytes]:
+    """Serialize a request body, using orjson when it is installed"""
+    if data is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _json_loads(content: bytes) -> Any:
+    """Parse a response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _build_http_session() -> requests.Session:
+    """
+    Build a shared HTTP session so Golang API calls reuse keep-alive connections
+    
+    Returns:
+        requests.Session: Session with a pooled adapter mounted for http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared session for all Golang API traffic
+_SESSION = _build_http_session()
+
+# (connect, read) timeouts in seconds: fail fast when the service is unreachable
+_REQUEST_TIMEOUT = (
+    float(os.getenv('GOLANG_API_CONNECT_TIMEOUT', '3')),
+    float(os.getenv('GOLANG_API_READ_TIMEOUT', '10'))
+)
+
 class GolangAPIAuth:
     """Handles authentication with Golang API services"""
     
@@ -43,11 +95,11 @@ class GolangAPIAuth:
             logger_access.info(f"🔐 Authenticating with: {self.base_url}/api/v1/auth/login")
             logger_access.info(f"🔐 Auth data: {auth_data}")
             
-            response = requests.post(
+            response = _SESSION.post(
                 f"{self.base_url}/api/v1/auth/login",
                 json=auth_data,
                 headers={"Content-Type": "application/json"},
-                timeout=10
+                timeout=_REQUEST_TIMEOUT
             )
             
             logger_access.info(f"🔐 Response Status: {response.status_code}")
@@ -56,7 +108,7 @@ class GolangAPIAuth:
             
             if response.status_code == 200:
                 try:
-                    auth_response = response.json()
+                    auth_response = _json_loads(response.content)
                     self.token = auth_response.get("access_token")
                     logger_access.info(f"✅ Successfully authenticated with Golang API")
                     logger_access.info(f"✅ Token: {self.token[:20] if self.token else 'None'}...")
@@ -109,13 +161,13 @@ class GolangAPIAuth:
                 logger_access.info(f"📤 Request data: {data}")
             
             if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
+                response = _SESSION.get(url, headers=headers, timeout=_REQUEST_TIMEOUT)
             elif method.upper() == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
+                response = _SESSION.post(url, data=_json_dumps(data), headers=headers, timeout=_REQUEST_TIMEOUT)
             elif method.upper() == 'PUT':
-                response = requests.put(url, json=data, headers=headers, timeout=10)
+                response = _SESSION.put(url, data=_json_dumps(data), headers=headers, timeout=_REQUEST_TIMEOUT)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=10)
+                response = _SESSION.delete(url, headers=headers, timeout=_REQUEST_TIMEOUT)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -124,7 +176,7 @@ class GolangAPIAuth:
             
             if response.status_code in [200, 201]:
                 try:
-                    return response.json()
+                    return _json_loads(response.content)
                 except json.JSONDecodeError:
                     logger_access.info("⚠️ Response is not valid JSON")
                     return {"success": True, "message": "Request successful"}
@@ -1,5 +1,10 @@
 import json
 import time
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 from .constants import ORDER_FILLED, ORDER_CANCELLED, ORDER_PARTIALLY_FILLED, ORDER_NEW, ORDER_UNKNOWN
 
 clients_dict = {}
@@ -156,9 +161,10 @@ def get_candle_data_info(symbol_redis, exchange_name, r, interval = '1h'):
 
     """
     now = int(time.time()*1000)
-    if r.exists(f'{symbol_redis}_{exchange_name}_candle_{interval}') < 1:
+    payload = r.get(f'{symbol_redis}_{exchange_name}_candle_{interval}')
+    if payload is None:
         return None
-    candles = json.loads(r.get(f'{symbol_redis}_{exchange_name}_candle_{interval}'))
+    candles = orjson.loads(payload) if orjson is not None else json.loads(payload)
     ts = float(candles['ts'])
     if now - ts >= 3000:
         return None
@@ -9,7 +9,7 @@ from math import floor, log10
 from inspect import currentframe
 from dotenv import load_dotenv
 import redis
-from database_mm import insert_error_logger, update_strategy_tracking_status
+from database_mm import insert_error_logger, queue_error_logger, update_strategy_tracking_status
 from logger import logger_database, logger_error, logger_access
 r1 = redis.Redis(host='localhost', port=6379, decode_responses=True, db=1) # manage make_order
 r2 = redis.Redis(host='localhost', port=6379, decode_responses=True, db=2) # manage apikey - exchange
@@ -213,7 +213,7 @@ def get_line_number():
     cf = currentframe()
     return cf.f_back.f_lineno
 
-def update_key_and_insert_error_log(run_key, symbol_raw, line_number,exchange_name,file_name, error_message):
+def update_key_and_insert_error_log(run_key, symbol_raw, line_number,exchange_name,file_name, error_message, queued=False):
     """
     Updates a run key and inserts an error log.
 
@@ -223,6 +223,9 @@ def update_key_and_insert_error_log(run_key, symbol_raw, line_number,exchange_na
         exchange_name (str): The name of the exchange.
         file_name (str): The name of the file.
         error_message (str): The error message to log.
+        queued (bool): Hand the row to the background batch writer instead of waiting for the insert.
+            Use it for errors the strategy loop recovers from; fatal errors keep the default so the
+            row is committed before the process exits.
 
     Returns:
         bool: True if the operation was successful.
@@ -234,5 +237,8 @@ def update_key_and_insert_error_log(run_key, symbol_raw, line_number,exchange_na
     info2 = f"{file_name} {line_number} - {symbol_raw} - {exchange_name} \
             {error_message}  {run_key} -- {status_run_key}"
     logger_error.error(info2)
-    insert_error_logger(file_name = file_name, line = get_line_number(),content = info2)
+    if queued:
+        queue_error_logger(file_name = file_name, line = get_line_number(),content = info2)
+    else:
+        insert_error_logger(file_name = file_name, line = get_line_number(),content = info2)
     return True